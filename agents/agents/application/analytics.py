@@ -5,18 +5,289 @@ Provides real-time P&L tracking, performance metrics calculation,
 and historical analysis of trading strategies.
 """
 
-from typing import Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
-from collections import defaultdict
 
-from sqlalchemy import func, and_
+import numpy as np
+from sqlalchemy import Float, func, and_, case, type_coerce
 from agents.utils.database import db, Trade, PerformanceMetric
 from agents.utils.config import config
 
 logger = logging.getLogger(__name__)
 
+_REPORT_RULE = "=" * 70
+_SECTION_RULE = "-" * 70
+
+
+def _empty_metrics() -> Dict:
+    """Metrics dictionary for a period with no trades."""
+    return {
+        "total_trades": 0,
+        "winning_trades": 0,
+        "losing_trades": 0,
+        "breakeven_trades": 0,
+        "win_rate": 0.0,
+        "total_profit": 0.0,
+        "total_loss": 0.0,
+        "net_profit": 0.0,
+        "avg_profit_per_trade": 0.0,
+        "avg_win": 0.0,
+        "avg_loss": 0.0,
+        "max_win": 0.0,
+        "max_loss": 0.0,
+        "profit_factor": 0.0,
+        "sharpe_ratio": 0.0,
+        "total_gas_cost": 0.0,
+    }
+
+
+def _metrics_kernel(returns: np.ndarray) -> Tuple:
+    """
+    Reduce a float64 array of per-trade net profits to the core statistics.
+
+    NaN entries are trades without a recorded profit: they count towards n and
+    contribute zero to the net profit, mean and standard deviation. Each
+    intermediate array (masks, wins, losses, deviations) is built once.
+
+    Returns:
+        (n, n_win, n_loss, n_breakeven, total_profit, total_loss,
+         max_win, max_loss, net_profit, mean, std)
+    """
+    n = returns.size
+    win_returns = returns[returns > 0]
+    loss_returns = returns[returns < 0]
+    net_returns = np.nan_to_num(returns)
+
+    net_profit = float(net_returns.sum())
+    if n:
+        mean = net_profit / n
+        deviations = net_returns - mean
+        std = float(np.sqrt((deviations * deviations).sum() / n))
+    else:
+        mean = std = 0.0
+
+    return (
+        n,
+        win_returns.size,
+        loss_returns.size,
+        int(np.count_nonzero(returns == 0)),
+        float(win_returns.sum()),
+        abs(float(loss_returns.sum())),
+        float(win_returns.max(initial=0.0)),
+        abs(float(loss_returns.min(initial=0.0))),
+        net_profit,
+        mean,
+        std,
+    )
+
+
+def _profit_gas_arrays(pairs: Iterable[Tuple], count: int = -1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Materialize (net_profit_usd, gas_cost_usd) pairs into two float64 arrays.
+
+    A missing net profit becomes NaN so the trade counts towards the total but is
+    neither a win, loss nor breakeven; a missing gas cost becomes zero.
+    """
+    values = np.fromiter(
+        (
+            (np.nan if net is None else float(net), float(gas or 0))
+            for net, gas in pairs
+        ),
+        dtype=np.dtype((np.float64, 2)),
+        count=count,
+    )
+    return values[:, 0], values[:, 1]
+
+
+def _sharpe_ratio(total_trades: int, avg_return: float, std_dev: float) -> float:
+    """
+    Simplified Sharpe ratio: mean return over population std dev of returns.
+
+    Zero for fewer than two trades or when the returns have no dispersion.
+    """
+    if total_trades < 2 or std_dev <= 0:
+        return 0.0
+    return avg_return / std_dev
+
+
+def _aggregate_columns() -> tuple:
+    """
+    SQL aggregate expressions from which every performance metric can be derived.
+
+    Trades without a recorded net profit count towards total_trades and contribute
+    zero to the return series, matching the in-memory calculation.
+    """
+    net_profit = func.coalesce(Trade.net_profit_usd, 0)
+    return (
+        func.count(Trade.id).label("total_trades"),
+        func.sum(case((Trade.net_profit_sign == 1, 1), else_=0)).label("winning_trades"),
+        func.sum(case((Trade.net_profit_sign == -1, 1), else_=0)).label("losing_trades"),
+        func.sum(case((Trade.net_profit_sign == 0, 1), else_=0)).label("breakeven_trades"),
+        func.sum(case((Trade.net_profit_usd > 0, Trade.net_profit_usd), else_=0)).label("gross_profit"),
+        func.sum(case((Trade.net_profit_usd < 0, Trade.net_profit_usd), else_=0)).label("gross_loss"),
+        func.max(Trade.net_profit_usd).label("max_net_profit"),
+        func.min(Trade.net_profit_usd).label("min_net_profit"),
+        func.sum(net_profit).label("net_profit"),
+        type_coerce(func.sum(net_profit * net_profit), Float).label("net_profit_squared"),
+        func.sum(func.coalesce(Trade.gas_cost_usd, 0)).label("total_gas_cost"),
+    )
+
+
+def _combine_aggregate_rows(rows) -> SimpleNamespace:
+    """
+    Merge grouped _aggregate_columns() rows into one overall row.
+
+    Every aggregate is a count, sum, min or max, so the per-group values combine
+    exactly without another pass over the trades.
+    """
+    def _sum(name):
+        values = [getattr(row, name) for row in rows if getattr(row, name) is not None]
+        return sum(values) if values else None
+
+    def _extreme(name, pick):
+        values = [getattr(row, name) for row in rows if getattr(row, name) is not None]
+        return pick(values) if values else None
+
+    return SimpleNamespace(
+        total_trades=_sum("total_trades") or 0,
+        winning_trades=_sum("winning_trades"),
+        losing_trades=_sum("losing_trades"),
+        breakeven_trades=_sum("breakeven_trades"),
+        gross_profit=_sum("gross_profit"),
+        gross_loss=_sum("gross_loss"),
+        max_net_profit=_extreme("max_net_profit", max),
+        min_net_profit=_extreme("min_net_profit", min),
+        net_profit=_sum("net_profit"),
+        net_profit_squared=_sum("net_profit_squared"),
+        total_gas_cost=_sum("total_gas_cost"),
+    )
+
+
+def _metrics_from_aggregates(row) -> Dict:
+    """
+    Build the metrics dictionary from one row of _aggregate_columns().
+
+    Variance is derived as E[x^2] - E[x]^2 so the Sharpe ratio needs no pass
+    over individual trades.
+    """
+    # Fast path; also covers empty groups without touching the other aggregates
+    total_trades = int(row.total_trades or 0)
+    if total_trades == 0:
+        return _empty_metrics()
+
+    num_winning = int(row.winning_trades or 0)
+    num_losing = int(row.losing_trades or 0)
+
+    total_profit = float(row.gross_profit or 0)
+    total_loss = abs(float(row.gross_loss or 0))
+    net_profit = float(row.net_profit or 0)
+
+    max_win = max(float(row.max_net_profit), 0.0) if row.max_net_profit is not None else 0.0
+    max_loss = abs(min(float(row.min_net_profit), 0.0)) if row.min_net_profit is not None else 0.0
+
+    # Population variance from the sums: E[x^2] - E[x]^2
+    avg_return = net_profit / total_trades
+    variance = max(float(row.net_profit_squared or 0) / total_trades - avg_return ** 2, 0.0)
+
+    return {
+        "total_trades": total_trades,
+        "winning_trades": num_winning,
+        "losing_trades": num_losing,
+        "breakeven_trades": int(row.breakeven_trades or 0),
+        "win_rate": num_winning / total_trades * 100,
+        "total_profit": total_profit,
+        "total_loss": total_loss,
+        "net_profit": net_profit,
+        "avg_profit_per_trade": net_profit / total_trades,
+        "avg_win": total_profit / num_winning if num_winning > 0 else 0.0,
+        "avg_loss": total_loss / num_losing if num_losing > 0 else 0.0,
+        "max_win": max_win,
+        "max_loss": max_loss,
+        "profit_factor": (total_profit / total_loss) if total_loss > 0 else 0.0,
+        "sharpe_ratio": _sharpe_ratio(total_trades, avg_return, variance ** 0.5),
+        "total_gas_cost": float(row.total_gas_cost or 0),
+    }
+
+
+def _to_decimal(value) -> Decimal:
+    """Coerce an aggregate result to Decimal without a float round trip when possible."""
+    if value is None:
+        return Decimal(0)
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def _decimal_metrics_from_aggregates(row) -> Dict:
+    """
+    Build the metrics dictionary from one row of _aggregate_columns(), keeping
+    money fields as Decimal.
+
+    Counts and ratios (win rate, profit factor, Sharpe) are the same floats that
+    _metrics_from_aggregates() returns.
+    """
+    metrics = _metrics_from_aggregates(row)
+    total_trades = metrics["total_trades"]
+    if total_trades == 0:
+        for key in ("total_profit", "total_loss", "net_profit", "avg_profit_per_trade",
+                    "avg_win", "avg_loss", "max_win", "max_loss", "total_gas_cost"):
+            metrics[key] = Decimal(0)
+        return metrics
+
+    num_winning = metrics["winning_trades"]
+    num_losing = metrics["losing_trades"]
+
+    total_profit = _to_decimal(row.gross_profit)
+    total_loss = abs(_to_decimal(row.gross_loss))
+    net_profit = _to_decimal(row.net_profit)
+
+    metrics.update({
+        "total_profit": total_profit,
+        "total_loss": total_loss,
+        "net_profit": net_profit,
+        "avg_profit_per_trade": net_profit / total_trades,
+        "avg_win": total_profit / num_winning if num_winning > 0 else Decimal(0),
+        "avg_loss": total_loss / num_losing if num_losing > 0 else Decimal(0),
+        "max_win": max(_to_decimal(row.max_net_profit), Decimal(0)),
+        "max_loss": abs(min(_to_decimal(row.min_net_profit), Decimal(0))),
+        "total_gas_cost": _to_decimal(row.total_gas_cost),
+    })
+    return metrics
+
+
+def _performance_metric_row(
+    period_type: str,
+    period_start: datetime,
+    period_end: datetime,
+    strategy: Optional[str],
+    metrics: Dict,
+) -> Dict:
+    """Map a calculate_metrics_decimal() result onto PerformanceMetric column values."""
+    return {
+        "period_type": period_type,
+        "period_start": period_start,
+        "period_end": period_end,
+        "strategy": strategy,
+        "total_trades": metrics["total_trades"],
+        "winning_trades": metrics["winning_trades"],
+        "losing_trades": metrics["losing_trades"],
+        "win_rate": metrics["win_rate"],
+        "total_profit_usd": metrics["total_profit"],
+        "total_loss_usd": metrics["total_loss"],
+        "net_profit_usd": metrics["net_profit"],
+        "avg_profit_per_trade": metrics["avg_profit_per_trade"],
+        "avg_win_amount": metrics["avg_win"],
+        "avg_loss_amount": metrics["avg_loss"],
+        "max_win": metrics["max_win"],
+        "max_loss": metrics["max_loss"],
+        "sharpe_ratio": metrics["sharpe_ratio"],
+        "profit_factor": metrics["profit_factor"],
+        "total_gas_cost_usd": metrics["total_gas_cost"],
+    }
+
 
 class PerformanceAnalyzer:
     """
@@ -48,101 +319,239 @@ class PerformanceAnalyzer:
         """
         session = db.get_session()
         try:
-            query = session.query(Trade)
+            query = self._apply_filters(
+                session.query(Trade), start_date, end_date, strategy, status
+            )
+            return query.all()
+        finally:
+            session.close()
 
-            if start_date:
-                query = query.filter(Trade.entry_time >= start_date)
+    def iter_trades(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Trade]:
+        """
+        Stream trades filtered by various criteria without building a list.
 
-            if end_date:
-                query = query.filter(Trade.entry_time <= end_date)
+        Rows are fetched in batches of batch_size, so memory stays flat for
+        callers that only reduce over the trades (e.g. calculate_metrics).
+        The session stays open until the iterator is exhausted or closed.
 
-            if strategy:
-                query = query.filter(Trade.strategy == strategy)
+        Args:
+            start_date: Filter trades after this date
+            end_date: Filter trades before this date
+            strategy: Filter by strategy name
+            status: Filter by trade status (open, closed, settled)
+            batch_size: Number of rows fetched per round trip
 
-            if status:
-                query = query.filter(Trade.status == status)
+        Yields:
+            Trade objects
+        """
+        session = db.get_session()
+        try:
+            query = self._apply_filters(
+                session.query(Trade), start_date, end_date, strategy, status
+            )
+            yield from (
+                query.execution_options(stream_results=True)
+                .yield_per(batch_size)
+            )
+        finally:
+            session.close()
 
-            return query.all()
+    @staticmethod
+    def _apply_filters(
+        query,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+    ):
+        """Apply the standard trade filters to a query."""
+        if start_date:
+            query = query.filter(Trade.entry_time >= start_date)
+
+        if end_date:
+            query = query.filter(Trade.entry_time <= end_date)
+
+        if strategy:
+            query = query.filter(Trade.strategy == strategy)
+
+        if status:
+            query = query.filter(Trade.status == status)
+
+        return query
+
+    def calculate_metrics_sql(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Dict:
+        """
+        Calculate performance metrics in the database with a single aggregate query.
+
+        Equivalent to calculate_metrics(get_all_trades(...)) but no Trade rows are
+        loaded into memory.
+
+        Args:
+            start_date: Filter trades after this date
+            end_date: Filter trades before this date
+            strategy: Filter by strategy name
+            status: Filter by trade status (open, closed, settled)
+
+        Returns:
+            Dictionary of performance metrics
+        """
+        session = db.get_session()
+        try:
+            query = self._apply_filters(
+                session.query(*_aggregate_columns()), start_date, end_date, strategy, status
+            )
+            return _metrics_from_aggregates(query.one())
+        finally:
+            session.close()
+
+    def calculate_metrics_decimal(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Dict:
+        """
+        Calculate performance metrics in the database, keeping money values exact.
+
+        Same keys as calculate_metrics_sql(), but profit, loss, average, extreme and
+        gas fields are Decimal as returned by the database, ready to persist into
+        Numeric columns without a float round trip.
+
+        Args:
+            start_date: Filter trades after this date
+            end_date: Filter trades before this date
+            strategy: Filter by strategy name
+            status: Filter by trade status (open, closed, settled)
+
+        Returns:
+            Dictionary of performance metrics
+        """
+        session = db.get_session()
+        try:
+            query = self._apply_filters(
+                session.query(*_aggregate_columns()), start_date, end_date, strategy, status
+            )
+            return _decimal_metrics_from_aggregates(query.one())
         finally:
             session.close()
 
     def calculate_metrics(
         self,
-        trades: List[Trade]
+        trades: Iterable[Trade]
     ) -> Dict:
         """
-        Calculate comprehensive performance metrics from a list of trades.
+        Calculate comprehensive performance metrics from trades.
+
+        Accepts a list or any iterable such as iter_trades(); the trades are read
+        in a single pass. Use calculate_metrics_sql() when the trades are not
+        already loaded.
 
         Args:
-            trades: List of Trade objects
+            trades: Iterable of Trade objects
 
         Returns:
             Dictionary of performance metrics
         """
-        if not trades:
-            return {
-                "total_trades": 0,
-                "winning_trades": 0,
-                "losing_trades": 0,
-                "breakeven_trades": 0,
-                "win_rate": 0.0,
-                "total_profit": 0.0,
-                "total_loss": 0.0,
-                "net_profit": 0.0,
-                "avg_profit_per_trade": 0.0,
-                "avg_win": 0.0,
-                "avg_loss": 0.0,
-                "max_win": 0.0,
-                "max_loss": 0.0,
-                "profit_factor": 0.0,
-                "sharpe_ratio": 0.0,
-                "total_gas_cost": 0.0,
-            }
+        returns, gas = _profit_gas_arrays(
+            ((t.net_profit_usd, t.gas_cost_usd) for t in trades),
+            count=len(trades) if hasattr(trades, "__len__") else -1,
+        )
+        return self.calculate_metrics_from_arrays(returns, gas)
 
-        # Separate winning and losing trades
-        winning_trades = [t for t in trades if t.net_profit_usd and float(t.net_profit_usd) > 0]
-        losing_trades = [t for t in trades if t.net_profit_usd and float(t.net_profit_usd) < 0]
-        breakeven_trades = [t for t in trades if t.net_profit_usd and float(t.net_profit_usd) == 0]
+    def get_trade_returns(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load per-trade net profit and gas cost as arrays without hydrating Trade objects.
 
-        # Calculate totals
-        total_profit = sum(float(t.net_profit_usd) for t in winning_trades)
-        total_loss = abs(sum(float(t.net_profit_usd) for t in losing_trades))
-        net_profit = sum(float(t.net_profit_usd or 0) for t in trades)
+        Args:
+            start_date: Filter trades after this date
+            end_date: Filter trades before this date
+            strategy: Filter by strategy name
+            status: Filter by trade status (open, closed, settled)
 
-        total_gas = sum(float(t.gas_cost_usd or 0) for t in trades)
+        Returns:
+            (returns, gas) float64 arrays; missing net profit is NaN
+        """
+        session = db.get_session()
+        try:
+            query = self._apply_filters(
+                session.query(Trade.net_profit_usd, Trade.gas_cost_usd),
+                start_date, end_date, strategy, status
+            )
+            return _profit_gas_arrays(query.all())
+        finally:
+            session.close()
 
-        # Calculate averages
-        total_trades = len(trades)
-        num_winning = len(winning_trades)
-        num_losing = len(losing_trades)
+    def calculate_metrics_from_arrays(
+        self,
+        returns: np.ndarray,
+        gas: np.ndarray
+    ) -> Dict:
+        """
+        Calculate performance metrics from per-trade arrays.
+
+        Args:
+            returns: float64 net profit per trade (NaN where not recorded)
+            gas: float64 gas cost per trade
 
-        win_rate = (num_winning / total_trades * 100) if total_trades > 0 else 0.0
-        avg_profit_per_trade = net_profit / total_trades if total_trades > 0 else 0.0
+        Returns:
+            Dictionary of performance metrics
+        """
+        total_trades = len(returns)
+        if total_trades == 0:
+            return _empty_metrics()
+
+        (
+            _,
+            num_winning,
+            num_losing,
+            num_breakeven,
+            total_profit,
+            total_loss,
+            max_win,
+            max_loss,
+            net_profit,
+            avg_return,
+            std_dev,
+        ) = _metrics_kernel(returns)
+
+        total_gas = float(gas.sum())
+
+        # Calculate averages
+        win_rate = num_winning / total_trades * 100
+        avg_profit_per_trade = avg_return
         avg_win = total_profit / num_winning if num_winning > 0 else 0.0
         avg_loss = total_loss / num_losing if num_losing > 0 else 0.0
 
-        # Calculate max win/loss
-        max_win = max((float(t.net_profit_usd) for t in winning_trades), default=0.0)
-        max_loss = abs(min((float(t.net_profit_usd) for t in losing_trades), default=0.0))
-
         # Profit factor (gross profit / gross loss)
         profit_factor = (total_profit / total_loss) if total_loss > 0 else 0.0
 
-        # Sharpe ratio (simplified: avg return / std dev of returns)
-        returns = [float(t.net_profit_usd or 0) for t in trades]
-        if len(returns) > 1:
-            avg_return = sum(returns) / len(returns)
-            variance = sum((r - avg_return) ** 2 for r in returns) / len(returns)
-            std_dev = variance ** 0.5
-            sharpe_ratio = (avg_return / std_dev) if std_dev > 0 else 0.0
-        else:
-            sharpe_ratio = 0.0
+        sharpe_ratio = _sharpe_ratio(total_trades, avg_return, std_dev)
 
         return {
             "total_trades": total_trades,
             "winning_trades": num_winning,
             "losing_trades": num_losing,
-            "breakeven_trades": len(breakeven_trades),
+            "breakeven_trades": num_breakeven,
             "win_rate": win_rate,
             "total_profit": total_profit,
             "total_loss": total_loss,
@@ -188,38 +597,44 @@ class PerformanceAnalyzer:
         finally:
             session.close()
 
-    def get_strategy_performance(self) -> Dict[str, Dict]:
+    def get_strategy_performance(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Dict]:
         """
         Get performance metrics broken down by strategy.
 
+        Args:
+            start_date: Filter trades after this date
+            end_date: Filter trades before this date
+
         Returns:
             Dictionary mapping strategy name to metrics
         """
         session = db.get_session()
         try:
-            # Get all closed trades
-            trades = session.query(Trade).filter(
-                Trade.status.in_(["closed", "settled"])
-            ).all()
-
-            # Group by strategy
-            by_strategy = defaultdict(list)
-            for trade in trades:
-                by_strategy[trade.strategy].append(trade)
-
-            # Calculate metrics for each strategy
-            results = {}
-            for strategy, strategy_trades in by_strategy.items():
-                results[strategy] = self.calculate_metrics(strategy_trades)
-
-            return results
+            query = self._apply_filters(
+                session.query(Trade.strategy, *_aggregate_columns()),
+                start_date, end_date, None, None
+            )
+            rows = (
+                query
+                .filter(Trade.status.in_(["closed", "settled"]))
+                .filter(Trade.strategy.isnot(None))
+                .group_by(Trade.strategy)
+                .all()
+            )
+
+            return {row.strategy: _metrics_from_aggregates(row) for row in rows}
         finally:
             session.close()
 
     def generate_performance_report(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        include_strategy_breakdown: bool = True
     ) -> str:
         """
         Generate a formatted performance report.
@@ -227,72 +642,116 @@ class PerformanceAnalyzer:
         Args:
             start_date: Start of reporting period
             end_date: End of reporting period
+            include_strategy_breakdown: Whether to add per-strategy sections
 
         Returns:
             Formatted report string
         """
-        # Get trades for period
-        trades = self.get_all_trades(
-            start_date=start_date,
-            end_date=end_date,
-            status="closed"
-        )
-
-        # Calculate metrics
-        metrics = self.calculate_metrics(trades)
+        if include_strategy_breakdown:
+            # One scan grouped by strategy and status gives both sections: the
+            # overall metrics cover closed trades, the strategy breakdown closed
+            # and settled ones (as in get_strategy_performance)
+            session = db.get_session()
+            try:
+                rows = (
+                    self._apply_filters(
+                        session.query(Trade.strategy, Trade.status, *_aggregate_columns()),
+                        start_date, end_date, None, None
+                    )
+                    .filter(Trade.status.in_(["closed", "settled"]))
+                    .group_by(Trade.strategy, Trade.status)
+                    .all()
+                )
+            finally:
+                session.close()
 
-        # Get strategy breakdown
-        strategy_performance = self.get_strategy_performance()
+            metrics = _metrics_from_aggregates(
+                _combine_aggregate_rows([row for row in rows if row.status == "closed"])
+            )
 
-        # Format report
-        report = []
-        report.append("=" * 70)
-        report.append("PERFORMANCE REPORT")
-        report.append("=" * 70)
+            rows_by_strategy = {}
+            for row in rows:
+                if row.strategy is not None:
+                    rows_by_strategy.setdefault(row.strategy, []).append(row)
+            strategy_performance = {
+                strategy: _metrics_from_aggregates(_combine_aggregate_rows(strategy_rows))
+                for strategy, strategy_rows in rows_by_strategy.items()
+            }
+        else:
+            metrics = self.calculate_metrics_sql(
+                start_date=start_date,
+                end_date=end_date,
+                status="closed"
+            )
+            strategy_performance = {}
 
         if start_date and end_date:
-            report.append(f"Period: {start_date.date()} to {end_date.date()}")
+            period = f"Period: {start_date.date()} to {end_date.date()}"
         elif start_date:
-            report.append(f"Period: {start_date.date()} to present")
+            period = f"Period: {start_date.date()} to present"
         else:
-            report.append("Period: All time")
-
-        report.append("")
-        report.append("OVERALL PERFORMANCE")
-        report.append("-" * 70)
-        report.append(f"Total Trades: {metrics['total_trades']}")
-        report.append(f"Winning: {metrics['winning_trades']} | Losing: {metrics['losing_trades']} | Breakeven: {metrics['breakeven_trades']}")
-        report.append(f"Win Rate: {metrics['win_rate']:.2f}%")
-        report.append("")
-        report.append(f"Net Profit: ${metrics['net_profit']:.2f}")
-        report.append(f"Total Profit: ${metrics['total_profit']:.2f}")
-        report.append(f"Total Loss: ${metrics['total_loss']:.2f}")
-        report.append(f"Total Gas Cost: ${metrics['total_gas_cost']:.2f}")
-        report.append("")
-        report.append(f"Avg Profit/Trade: ${metrics['avg_profit_per_trade']:.2f}")
-        report.append(f"Avg Win: ${metrics['avg_win']:.2f}")
-        report.append(f"Avg Loss: ${metrics['avg_loss']:.2f}")
-        report.append(f"Max Win: ${metrics['max_win']:.2f}")
-        report.append(f"Max Loss: ${metrics['max_loss']:.2f}")
-        report.append("")
-        report.append(f"Profit Factor: {metrics['profit_factor']:.2f}")
-        report.append(f"Sharpe Ratio: {metrics['sharpe_ratio']:.2f}")
+            period = "Period: All time"
+
+        # Unpack once so the formatting below reads locals, not dict lookups
+        total_trades = metrics["total_trades"]
+        winning_trades = metrics["winning_trades"]
+        losing_trades = metrics["losing_trades"]
+        breakeven_trades = metrics["breakeven_trades"]
+        win_rate = metrics["win_rate"]
+        net_profit = metrics["net_profit"]
+        total_profit = metrics["total_profit"]
+        total_loss = metrics["total_loss"]
+        total_gas_cost = metrics["total_gas_cost"]
+        avg_profit_per_trade = metrics["avg_profit_per_trade"]
+        avg_win = metrics["avg_win"]
+        avg_loss = metrics["avg_loss"]
+        max_win = metrics["max_win"]
+        max_loss = metrics["max_loss"]
+        profit_factor = metrics["profit_factor"]
+        sharpe_ratio = metrics["sharpe_ratio"]
+
+        # Format report
+        report = [
+            _REPORT_RULE,
+            "PERFORMANCE REPORT",
+            _REPORT_RULE,
+            period,
+            "",
+            "OVERALL PERFORMANCE",
+            _SECTION_RULE,
+            f"Total Trades: {total_trades}",
+            f"Winning: {winning_trades} | Losing: {losing_trades} | Breakeven: {breakeven_trades}",
+            f"Win Rate: {win_rate:.2f}%",
+            "",
+            f"Net Profit: ${net_profit:.2f}",
+            f"Total Profit: ${total_profit:.2f}",
+            f"Total Loss: ${total_loss:.2f}",
+            f"Total Gas Cost: ${total_gas_cost:.2f}",
+            "",
+            f"Avg Profit/Trade: ${avg_profit_per_trade:.2f}",
+            f"Avg Win: ${avg_win:.2f}",
+            f"Avg Loss: ${avg_loss:.2f}",
+            f"Max Win: ${max_win:.2f}",
+            f"Max Loss: ${max_loss:.2f}",
+            "",
+            f"Profit Factor: {profit_factor:.2f}",
+            f"Sharpe Ratio: {sharpe_ratio:.2f}",
+        ]
 
         # Strategy breakdown
         if strategy_performance:
-            report.append("")
-            report.append("STRATEGY PERFORMANCE")
-            report.append("-" * 70)
+            report.extend(("", "STRATEGY PERFORMANCE", _SECTION_RULE))
             for strategy, strat_metrics in strategy_performance.items():
-                report.append(f"\n{strategy}:")
-                report.append(f"  Trades: {strat_metrics['total_trades']}")
-                report.append(f"  Win Rate: {strat_metrics['win_rate']:.2f}%")
-                report.append(f"  Net Profit: ${strat_metrics['net_profit']:.2f}")
-                report.append(f"  Avg Profit/Trade: ${strat_metrics['avg_profit_per_trade']:.2f}")
-                report.append(f"  Profit Factor: {strat_metrics['profit_factor']:.2f}")
+                report.extend((
+                    f"\n{strategy}:",
+                    f"  Trades: {strat_metrics['total_trades']}",
+                    f"  Win Rate: {strat_metrics['win_rate']:.2f}%",
+                    f"  Net Profit: ${strat_metrics['net_profit']:.2f}",
+                    f"  Avg Profit/Trade: ${strat_metrics['avg_profit_per_trade']:.2f}",
+                    f"  Profit Factor: {strat_metrics['profit_factor']:.2f}",
+                ))
 
-        report.append("")
-        report.append("=" * 70)
+        report.extend(("", _REPORT_RULE))
 
         return "\n".join(report)
 
@@ -315,40 +774,19 @@ class PerformanceAnalyzer:
         Returns:
             Created PerformanceMetric object
         """
-        # Get trades for period
-        trades = self.get_all_trades(
+        # Calculate metrics for period
+        metrics = self.calculate_metrics_decimal(
             start_date=period_start,
             end_date=period_end,
             strategy=strategy,
             status="closed"
         )
 
-        # Calculate metrics
-        metrics = self.calculate_metrics(trades)
-
         # Save to database
         session = db.get_session()
         try:
             perf_metric = PerformanceMetric(
-                period_type=period_type,
-                period_start=period_start,
-                period_end=period_end,
-                strategy=strategy,
-                total_trades=metrics["total_trades"],
-                winning_trades=metrics["winning_trades"],
-                losing_trades=metrics["losing_trades"],
-                win_rate=metrics["win_rate"],
-                total_profit_usd=Decimal(str(metrics["total_profit"])),
-                total_loss_usd=Decimal(str(metrics["total_loss"])),
-                net_profit_usd=Decimal(str(metrics["net_profit"])),
-                avg_profit_per_trade=Decimal(str(metrics["avg_profit_per_trade"])),
-                avg_win_amount=Decimal(str(metrics["avg_win"])),
-                avg_loss_amount=Decimal(str(metrics["avg_loss"])),
-                max_win=Decimal(str(metrics["max_win"])),
-                max_loss=Decimal(str(metrics["max_loss"])),
-                sharpe_ratio=metrics["sharpe_ratio"],
-                profit_factor=metrics["profit_factor"],
-                total_gas_cost_usd=Decimal(str(metrics["total_gas_cost"])),
+                **_performance_metric_row(period_type, period_start, period_end, strategy, metrics)
             )
 
             session.add(perf_metric)
@@ -365,6 +803,50 @@ class PerformanceAnalyzer:
         finally:
             session.close()
 
+    def save_performance_metrics_bulk(self, periods: List[Dict]) -> int:
+        """
+        Calculate and save performance metrics for many periods in one transaction.
+
+        Intended for backfills and nightly jobs; use save_performance_metric()
+        when the created row is needed.
+
+        Args:
+            periods: Dicts with period_type, period_start, period_end and
+                optional strategy keys
+
+        Returns:
+            Number of metric rows written
+        """
+        rows = []
+        for period in periods:
+            strategy = period.get("strategy")
+            metrics = self.calculate_metrics_decimal(
+                start_date=period["period_start"],
+                end_date=period["period_end"],
+                strategy=strategy,
+                status="closed"
+            )
+            rows.append(_performance_metric_row(
+                period["period_type"],
+                period["period_start"],
+                period["period_end"],
+                strategy,
+                metrics,
+            ))
+
+        if not rows:
+            return 0
+
+        session = db.get_session()
+        try:
+            session.bulk_insert_mappings(PerformanceMetric, rows)
+            session.commit()
+
+            self.logger.info(f"Saved {len(rows)} performance metrics")
+            return len(rows)
+        finally:
+            session.close()
+
 
 if __name__ == "__main__":
     # Test analytics
@@ -5,10 +5,15 @@ Implements position sizing, portfolio limits, stop-losses, and other risk contro
 to protect capital and ensure sustainable trading.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
+import threading
+
+import numpy as np
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
 
 from agents.utils.config import config
 from agents.utils.database import db, Trade
@@ -22,12 +27,24 @@ except (ImportError, ModuleNotFoundError):
 logger = logging.getLogger(__name__)
 
 
+class OpenPositionStats(NamedTuple):
+    """Aggregated view of currently open positions."""
+
+    count: int
+    total_exposure: float
+    exposure_by_market: Dict[str, float]
+
+
 class RiskManager:
     """
     Manages risk across all trading strategies.
     Enforces position limits, diversification, and loss limits.
     """
 
+    # Held while a strategy validates and records trades, so strategies run in
+    # parallel cannot both pass the exposure checks for the same capital
+    trade_lock = threading.Lock()
+
     def __init__(self, polymarket_client: Optional[Polymarket] = None):
         """
         Initialize risk manager.
@@ -78,14 +95,10 @@ class RiskManager:
 
         # Kelly Criterion: f* = (bp - q) / b
         # where b = odds, p = win probability, q = 1 - p
-        # Simplified for prediction markets where expected return is direct
-        kelly_fraction = (confidence - (1 - confidence)) / 1.0
-
-        # Apply safety margin (half Kelly for more conservative sizing)
-        kelly_fraction = kelly_fraction * 0.5
-
-        # Ensure within bounds
-        kelly_fraction = max(0, min(kelly_fraction, 1.0))
+        # Simplified for prediction markets (b = 1): f* = 2p - 1.
+        # Half Kelly for more conservative sizing gives p - 0.5, which never
+        # exceeds 0.5 for p <= 1, so only the lower bound needs clamping.
+        kelly_fraction = max(confidence - 0.5, 0.0)
 
         # Apply maximum position size limit
         max_pct = max_position_pct or config.MAX_POSITION_SIZE_PCT
@@ -105,44 +118,92 @@ class RiskManager:
 
         return position_size
 
-    def get_open_positions(self) -> List[Trade]:
+    def calculate_position_sizes(
+        self,
+        confidences: np.ndarray,
+        max_position_pct: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size for batches of candidate trades.
+
+        Applies the same half-Kelly sizing and position cap to every confidence,
+        fetching available capital once. Intended for backtests and grid searches.
+
+        Args:
+            confidences: Array of confidences in prediction (0-1)
+            max_position_pct: Optional override for max position size
+
+        Returns:
+            Array of position sizes in USDC, same shape as confidences
+        """
+        available_capital = self.get_available_capital()
+
+        max_pct = max_position_pct or config.MAX_POSITION_SIZE_PCT
+        max_fraction = max_pct / 100.0
+
+        confidences = np.asarray(confidences, dtype=np.float64)
+        final_fractions = np.clip(confidences - 0.5, 0.0, max_fraction)
+
+        return available_capital * final_fractions
+
+    def get_open_positions(self, session: Optional[Session] = None) -> List[Trade]:
         """Get all currently open trades."""
-        session = db.get_session()
-        try:
+        with db.session_scope(session) as session:
             return session.query(Trade).filter(Trade.status == "open").all()
-        finally:
-            session.close()
 
-    def get_position_count(self) -> int:
+    def get_open_position_stats(self, session: Optional[Session] = None) -> OpenPositionStats:
+        """
+        Get position count and exposure for open trades in a single query.
+
+        Args:
+            session: Optional session to reuse (a new one is opened if not provided)
+
+        Returns:
+            OpenPositionStats with count, total exposure and per-market exposure
+        """
+        with db.session_scope(session) as session:
+            rows = (
+                session.query(
+                    Trade.market_id,
+                    func.count(Trade.id),
+                    func.coalesce(func.sum(Trade.size_usd), 0),
+                )
+                .filter(Trade.status == "open")
+                .group_by(Trade.market_id)
+                .all()
+            )
+
+        exposure_by_market = {market_id: float(exposure) for market_id, _, exposure in rows}
+        return OpenPositionStats(
+            count=sum(count for _, count, _ in rows),
+            total_exposure=sum(exposure_by_market.values()),
+            exposure_by_market=exposure_by_market,
+        )
+
+    def get_position_count(self, session: Optional[Session] = None) -> int:
         """Get number of open positions."""
-        return len(self.get_open_positions())
+        return self.get_open_position_stats(session).count
 
-    def get_total_exposure(self) -> float:
+    def get_total_exposure(self, session: Optional[Session] = None) -> float:
         """Get total capital currently deployed in open positions."""
-        open_positions = self.get_open_positions()
-        total = sum(float(trade.size_usd) for trade in open_positions)
-        return total
+        return self.get_open_position_stats(session).total_exposure
 
-    def get_exposure_by_market(self) -> Dict[str, float]:
+    def get_exposure_by_market(self, session: Optional[Session] = None) -> Dict[str, float]:
         """Get exposure grouped by market."""
-        open_positions = self.get_open_positions()
-        exposure = {}
-        for trade in open_positions:
-            market_id = trade.market_id
-            if market_id in exposure:
-                exposure[market_id] += float(trade.size_usd)
-            else:
-                exposure[market_id] = float(trade.size_usd)
-        return exposure
-
-    def check_diversification(self) -> Tuple[bool, str]:
+        return self.get_open_position_stats(session).exposure_by_market
+
+    def check_diversification(self, position_count: Optional[int] = None) -> Tuple[bool, str]:
         """
         Check if portfolio meets diversification requirements.
 
+        Args:
+            position_count: Pre-computed open position count (queried if not provided)
+
         Returns:
             (is_diversified, message)
         """
-        position_count = self.get_position_count()
+        if position_count is None:
+            position_count = self.get_position_count()
         min_markets = config.MIN_MARKETS_FOR_DIVERSIFICATION
 
         if position_count == 0:
@@ -153,18 +214,27 @@ class RiskManager:
 
         return True, f"Portfolio diversified with {position_count} positions"
 
-    def check_position_limit(self, new_position_size: float, market_id: str) -> Tuple[bool, str]:
+    def check_position_limit(
+        self,
+        new_position_size: float,
+        market_id: str,
+        available_capital: Optional[float] = None,
+        session: Optional[Session] = None,
+    ) -> Tuple[bool, str]:
         """
         Check if a new position would exceed position size limits.
 
         Args:
             new_position_size: Size of proposed new position
             market_id: Market identifier
+            available_capital: Pre-fetched capital (fetched if not provided)
+            session: Optional session to reuse (a new one is opened if not provided)
 
         Returns:
             (is_allowed, message)
         """
-        available_capital = self.get_available_capital()
+        if available_capital is None:
+            available_capital = self.get_available_capital()
         max_position_size = available_capital * (config.MAX_POSITION_SIZE_PCT / 100.0)
 
         # Check single position limit
@@ -172,7 +242,7 @@ class RiskManager:
             return False, f"Position size ${new_position_size:.2f} exceeds max ${max_position_size:.2f}"
 
         # Check if we already have exposure to this market
-        market_exposure = self.get_exposure_by_market()
+        market_exposure = self.get_exposure_by_market(session)
         existing_exposure = market_exposure.get(market_id, 0)
         total_market_exposure = existing_exposure + new_position_size
 
@@ -184,79 +254,122 @@ class RiskManager:
 
         return True, "Position size acceptable"
 
-    def check_daily_loss_limit(self) -> Tuple[bool, str]:
+    @staticmethod
+    def _loss_limit_status(
+        period: str,
+        period_text: str,
+        limit_pct: float,
+        trade_count: int,
+        pnl,
+        available_capital: float,
+    ) -> Tuple[bool, str]:
         """
-        Check if daily loss limit has been breached.
+        Judge one period's realized P&L against its loss limit.
+
+        Args:
+            period: "Daily" or "Weekly", used in messages
+            period_text: "today" or "this week", used when there are no trades
+            limit_pct: Loss limit as % of available capital
+            trade_count: Completed trades in the period
+            pnl: Net P&L of those trades
+            available_capital: Capital the limit is relative to
 
         Returns:
             (is_ok, message)
         """
-        session = db.get_session()
-        try:
-            # Get today's trades
-            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            today_trades = (
-                session.query(Trade)
-                .filter(Trade.entry_time >= today_start)
-                .filter(Trade.status.in_(["closed", "settled"]))
-                .all()
-            )
-
-            if not today_trades:
-                return True, "No completed trades today"
-
-            # Calculate today's P&L
-            today_pnl = sum(
-                float(trade.net_profit_usd or 0) for trade in today_trades
-            )
-
-            available_capital = self.get_available_capital()
-            max_daily_loss = available_capital * (config.DAILY_LOSS_LIMIT_PCT / 100.0)
+        if not trade_count:
+            return True, f"No completed trades {period_text}"
 
-            if today_pnl < -max_daily_loss:
-                return False, f"Daily loss ${abs(today_pnl):.2f} exceeds limit ${max_daily_loss:.2f}"
+        pnl = float(pnl)
+        max_loss = available_capital * (limit_pct / 100.0)
 
-            return True, f"Daily P&L: ${today_pnl:.2f}"
+        if pnl < -max_loss:
+            return False, f"{period} loss ${abs(pnl):.2f} exceeds limit ${max_loss:.2f}"
 
-        finally:
-            session.close()
+        return True, f"{period} P&L: ${pnl:.2f}"
 
-    def check_weekly_loss_limit(self) -> Tuple[bool, str]:
+    def check_loss_limits(
+        self,
+        available_capital: Optional[float] = None,
+        session: Optional[Session] = None,
+    ) -> Tuple[Tuple[bool, str], Tuple[bool, str]]:
         """
-        Check if weekly loss limit has been breached.
+        Check the daily and weekly loss limits with a single aggregate query.
+
+        Args:
+            available_capital: Pre-fetched capital (fetched if not provided and
+                there are completed trades)
+            session: Optional session to reuse (a new one is opened if not provided)
 
         Returns:
-            (is_ok, message)
+            ((daily_ok, daily_message), (weekly_ok, weekly_message))
         """
-        session = db.get_session()
-        try:
-            # Get this week's trades
-            week_start = datetime.utcnow() - timedelta(days=7)
-            week_trades = (
-                session.query(Trade)
+        now = datetime.utcnow()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = now - timedelta(days=7)
+
+        # The weekly window always contains today, so one scan covers both
+        is_today = Trade.entry_time >= today_start
+        with db.session_scope(session) as session:
+            today_count, today_pnl, week_count, week_pnl = (
+                session.query(
+                    func.count(case((is_today, Trade.id))),
+                    func.coalesce(func.sum(case((is_today, Trade.net_profit_usd))), 0),
+                    func.count(Trade.id),
+                    func.coalesce(func.sum(Trade.net_profit_usd), 0),
+                )
                 .filter(Trade.entry_time >= week_start)
                 .filter(Trade.status.in_(["closed", "settled"]))
-                .all()
+                .one()
             )
 
-            if not week_trades:
-                return True, "No completed trades this week"
+        if available_capital is None and (today_count or week_count):
+            available_capital = self.get_available_capital()
 
-            # Calculate week's P&L
-            week_pnl = sum(
-                float(trade.net_profit_usd or 0) for trade in week_trades
-            )
+        return (
+            self._loss_limit_status(
+                "Daily", "today", config.DAILY_LOSS_LIMIT_PCT,
+                today_count, today_pnl, available_capital
+            ),
+            self._loss_limit_status(
+                "Weekly", "this week", config.WEEKLY_LOSS_LIMIT_PCT,
+                week_count, week_pnl, available_capital
+            ),
+        )
 
-            available_capital = self.get_available_capital()
-            max_weekly_loss = available_capital * (config.WEEKLY_LOSS_LIMIT_PCT / 100.0)
+    def check_daily_loss_limit(
+        self,
+        available_capital: Optional[float] = None,
+        session: Optional[Session] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Check if daily loss limit has been breached.
+
+        Args:
+            available_capital: Pre-fetched capital (fetched if not provided)
+            session: Optional session to reuse (a new one is opened if not provided)
+
+        Returns:
+            (is_ok, message)
+        """
+        return self.check_loss_limits(available_capital, session)[0]
 
-            if week_pnl < -max_weekly_loss:
-                return False, f"Weekly loss ${abs(week_pnl):.2f} exceeds limit ${max_weekly_loss:.2f}"
+    def check_weekly_loss_limit(
+        self,
+        available_capital: Optional[float] = None,
+        session: Optional[Session] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Check if weekly loss limit has been breached.
 
-            return True, f"Weekly P&L: ${week_pnl:.2f}"
+        Args:
+            available_capital: Pre-fetched capital (fetched if not provided)
+            session: Optional session to reuse (a new one is opened if not provided)
 
-        finally:
-            session.close()
+        Returns:
+            (is_ok, message)
+        """
+        return self.check_loss_limits(available_capital, session)[1]
 
     def validate_trade(
         self,
@@ -279,20 +392,22 @@ class RiskManager:
         """
         errors = []
 
-        # Check position size limits
-        is_ok, msg = self.check_position_limit(position_size, market_id)
-        if not is_ok:
-            errors.append(msg)
+        # Fetch balance once; in live mode each call is a network round trip
+        available_capital = self.get_available_capital()
 
-        # Check daily loss limit
-        is_ok, msg = self.check_daily_loss_limit()
-        if not is_ok:
-            errors.append(msg)
+        # Run the database-backed checks on one shared session
+        with db.session_scope() as session:
+            # Check position size limits
+            is_ok, msg = self.check_position_limit(
+                position_size, market_id, available_capital, session=session
+            )
+            if not is_ok:
+                errors.append(msg)
 
-        # Check weekly loss limit
-        is_ok, msg = self.check_weekly_loss_limit()
-        if not is_ok:
-            errors.append(msg)
+            # Check daily and weekly loss limits
+            for is_ok, msg in self.check_loss_limits(available_capital, session=session):
+                if not is_ok:
+                    errors.append(msg)
 
         # Check gas cost vs profit
         gas_pct = (gas_cost_estimate / expected_profit * 100) if expected_profit > 0 else 100
@@ -319,54 +434,73 @@ class RiskManager:
             Dictionary with risk metrics
         """
         available_capital = self.get_available_capital()
-        open_positions = self.get_open_positions()
-        total_exposure = self.get_total_exposure()
 
-        daily_ok, daily_msg = self.check_daily_loss_limit()
-        weekly_ok, weekly_msg = self.check_weekly_loss_limit()
-        diversification_ok, diversification_msg = self.check_diversification()
+        with db.session_scope() as session:
+            positions = self.get_open_position_stats(session)
+            (daily_ok, daily_msg), (weekly_ok, weekly_msg) = self.check_loss_limits(
+                available_capital, session=session
+            )
+
+        total_exposure = positions.total_exposure
+        diversification_ok, diversification_msg = self.check_diversification(positions.count)
 
         return {
             "available_capital": available_capital,
             "total_exposure": total_exposure,
             "exposure_pct": (total_exposure / available_capital * 100) if available_capital > 0 else 0,
-            "open_positions": len(open_positions),
-            "positions_by_market": self.get_exposure_by_market(),
+            "open_positions": positions.count,
+            "positions_by_market": positions.exposure_by_market,
             "daily_status": {"ok": daily_ok, "message": daily_msg},
             "weekly_status": {"ok": weekly_ok, "message": weekly_msg},
             "diversification_status": {"ok": diversification_ok, "message": diversification_msg},
             "paper_trading_mode": config.PAPER_TRADING_MODE,
         }
 
-    def print_risk_summary(self):
-        """Print a formatted risk summary."""
-        summary = self.get_risk_summary()
-
-        print("\n" + "=" * 60)
-        print("RISK MANAGEMENT SUMMARY")
-        print("=" * 60)
+    def format_risk_summary(self, summary: Optional[Dict] = None) -> str:
+        """
+        Format a risk summary as printable text.
 
-        print(f"\nCapital:")
-        print(f"  Available: ${summary['available_capital']:.2f}")
-        print(f"  Deployed: ${summary['total_exposure']:.2f} ({summary['exposure_pct']:.1f}%)")
+        Args:
+            summary: Result of get_risk_summary() (fetched if not provided)
 
-        print(f"\nPositions:")
-        print(f"  Open: {summary['open_positions']}")
+        Returns:
+            Formatted risk summary string
+        """
+        if summary is None:
+            summary = self.get_risk_summary()
+
+        lines = [
+            "\n" + "=" * 60,
+            "RISK MANAGEMENT SUMMARY",
+            "=" * 60,
+            "\nCapital:",
+            f"  Available: ${summary['available_capital']:.2f}",
+            f"  Deployed: ${summary['total_exposure']:.2f} ({summary['exposure_pct']:.1f}%)",
+            "\nPositions:",
+            f"  Open: {summary['open_positions']}",
+        ]
         if summary['positions_by_market']:
-            print("  By market:")
-            for market_id, exposure in summary['positions_by_market'].items():
-                print(f"    {market_id}: ${exposure:.2f}")
-
-        print(f"\nLoss Limits:")
-        print(f"  Daily: {'✓' if summary['daily_status']['ok'] else '✗'} {summary['daily_status']['message']}")
-        print(f"  Weekly: {'✓' if summary['weekly_status']['ok'] else '✗'} {summary['weekly_status']['message']}")
+            lines.append("  By market:")
+            lines.extend(
+                f"    {market_id}: ${exposure:.2f}"
+                for market_id, exposure in summary['positions_by_market'].items()
+            )
 
-        print(f"\nDiversification:")
-        print(f"  {'✓' if summary['diversification_status']['ok'] else '✗'} {summary['diversification_status']['message']}")
+        lines.extend((
+            "\nLoss Limits:",
+            f"  Daily: {'✓' if summary['daily_status']['ok'] else '✗'} {summary['daily_status']['message']}",
+            f"  Weekly: {'✓' if summary['weekly_status']['ok'] else '✗'} {summary['weekly_status']['message']}",
+            "\nDiversification:",
+            f"  {'✓' if summary['diversification_status']['ok'] else '✗'} {summary['diversification_status']['message']}",
+            f"\nMode: {'PAPER TRADING' if summary['paper_trading_mode'] else 'LIVE TRADING'}",
+            "=" * 60 + "\n",
+        ))
 
-        print(f"\nMode: {'PAPER TRADING' if summary['paper_trading_mode'] else 'LIVE TRADING'}")
-        print("=" * 60 + "\n")
+        return "\n".join(lines)
 
+    def print_risk_summary(self):
+        """Print a formatted risk summary with a single write."""
+        print(self.format_risk_summary())
 
 if __name__ == "__main__":
     # Test risk manager
@@ -18,10 +18,16 @@ Key Features:
 4. Whale activity monitoring
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, NamedTuple, Optional, Any, Tuple
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 import logging
 import json
+import time
+
+import numpy as np
 
 from agents.application.strategy_manager import TradingStrategy
 from agents.application.risk_manager import RiskManager
@@ -37,6 +43,23 @@ except (ImportError, ModuleNotFoundError):
 
 logger = logging.getLogger(__name__)
 
+# Lowercased tag labels that carry elevated reversal risk
+HIGH_RISK_TAGS = frozenset({'sports'})
+
+
+class EndgameOpportunity(NamedTuple):
+    """One side of a market that passed all endgame sweep filters."""
+
+    market_id: str
+    market_question: str
+    side: str
+    entry_price: float
+    confidence: float
+    expected_profit_pct: float
+    black_swan_risk: float
+    reasoning: str
+    position_size_usd: Optional[float] = None
+
 
 class EndgameSweepStrategy(TradingStrategy):
     """
@@ -95,39 +118,73 @@ class EndgameSweepStrategy(TradingStrategy):
         except Exception as e:
             self.logger.warning(f"Could not load settings from database, using defaults: {e}")
 
-    def is_near_settlement(self, market: dict) -> bool:
+    @staticmethod
+    def _tag_set(market: dict) -> frozenset:
+        """Return the market's tag labels, lowercased, as a frozenset."""
+        return frozenset(
+            (tag.get('label') or '').lower() if isinstance(tag, dict) else str(tag).lower()
+            for tag in market.get('tags') or ()
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _end_ts(end_date_str: str) -> float:
+        """Convert an ISO end date to epoch seconds (memoized across scans)."""
+        return datetime.fromisoformat(end_date_str.replace('Z', '+00:00')).timestamp()
+
+    def _hours_to_settlement(self, market: dict, now_ts: Optional[float] = None) -> Optional[float]:
         """
-        Check if market is close to settlement.
+        Return the hours left until the market's end date.
 
         Args:
             market: Market dictionary from API
+            now_ts: Current epoch seconds, shared across a scan (time.time() if not provided)
 
         Returns:
-            True if market will settle soon
+            Hours to settlement, or None if the market has no parseable end date
         """
-        # Check if market has an end date
-        end_date_str = market.get('endDate') or market.get('end_date_iso')
-        if end_date_str:
-            try:
-                end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                time_to_settlement = end_date - datetime.now(end_date.tzinfo)
+        end_ts = self._market_end_ts(market)
+        if np.isnan(end_ts):
+            return None
 
-                hours_to_settlement = time_to_settlement.total_seconds() / 3600
+        if now_ts is None:
+            now_ts = time.time()
 
-                if hours_to_settlement <= self.max_hours_to_settlement:
-                    market_id = market.get('id', 'unknown')
-                    self.logger.debug(
-                        f"Market {market_id} settles in {hours_to_settlement:.1f}h"
-                    )
-                    return True
+        return (end_ts - now_ts) / 3600
 
-            except Exception as e:
-                market_id = market.get('id', 'unknown')
-                self.logger.debug(f"Error parsing end date for {market_id}: {e}")
+    def is_near_settlement(
+        self,
+        market: dict,
+        hours_to_settlement: Optional[float] = None
+    ) -> bool:
+        """
+        Check if market is close to settlement.
+
+        Args:
+            market: Market dictionary from API
+            hours_to_settlement: Pre-computed hours to settlement (parsed if not provided)
+
+        Returns:
+            True if market will settle soon
+        """
+        if hours_to_settlement is None:
+            hours_to_settlement = self._hours_to_settlement(market)
+
+        if hours_to_settlement is not None and hours_to_settlement <= self.max_hours_to_settlement:
+            market_id = market.get('id', 'unknown')
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Market {market_id} settles in {hours_to_settlement:.1f}h"
+                )
+            return True
 
         return False
 
-    def calculate_black_swan_risk(self, market: dict) -> float:
+    def calculate_black_swan_risk(
+        self,
+        market: dict,
+        hours_to_settlement: Optional[float] = None
+    ) -> float:
         """
         Estimate black swan risk for a market.
 
@@ -136,6 +193,39 @@ class EndgameSweepStrategy(TradingStrategy):
 
         Args:
             market: Market dictionary from API
+            hours_to_settlement: Pre-computed hours to settlement (parsed if not provided)
+
+        Returns:
+            Risk score from 0 (low risk) to 1 (high risk)
+        """
+        tags = self._tag_set(market)
+        if hours_to_settlement is None:
+            hours_to_settlement = self._hours_to_settlement(market)
+
+        return self._score_black_swan_risk(tags, hours_to_settlement)
+
+    @staticmethod
+    def _settlement_horizon(hours_to_settlement: Optional[float]) -> Optional[int]:
+        """Bucket hours to settlement by the black swan time thresholds."""
+        if hours_to_settlement is None:
+            return None
+        if hours_to_settlement > 12:
+            return 2
+        if hours_to_settlement > 6:
+            return 1
+        return 0
+
+    def _score_black_swan_risk(
+        self,
+        tags: frozenset,
+        hours_to_settlement: Optional[float]
+    ) -> float:
+        """
+        Score black swan risk from market tags and time to settlement.
+
+        Args:
+            tags: Lowercased tag labels of the market
+            hours_to_settlement: Hours to settlement, or None if unknown
 
         Returns:
             Risk score from 0 (low risk) to 1 (high risk)
@@ -146,29 +236,19 @@ class EndgameSweepStrategy(TradingStrategy):
         # For now, use simple heuristics:
 
         # 1. Check market category (sports have higher reversal risk)
-        tags = market.get('tags', [])
-        if tags:
-            tag_names = [tag.get('label', '').lower() if isinstance(tag, dict) else str(tag).lower() for tag in tags]
-            if 'sports' in tag_names:
-                risk_score += 0.2
+        if tags & HIGH_RISK_TAGS:
+            risk_score += 0.2
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"Sports market - increased black swan risk")
 
         # 2. Check time to settlement (longer time = higher risk)
         # Markets settling in <1 hour are very low risk
         # Markets settling in 12-24 hours have medium risk
-        end_date_str = market.get('endDate') or market.get('end_date_iso')
-        if end_date_str:
-            try:
-                end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                hours_to_settlement = (end_date - datetime.now(end_date.tzinfo)).total_seconds() / 3600
-
-                if hours_to_settlement > 12:
-                    risk_score += 0.3
-                elif hours_to_settlement > 6:
-                    risk_score += 0.1
-
-            except Exception:
-                pass
+        horizon = self._settlement_horizon(hours_to_settlement)
+        if horizon == 2:
+            risk_score += 0.3
+        elif horizon == 1:
+            risk_score += 0.1
 
         # 3. Check price volatility
         # If price is exactly 0.99+, it's less likely to reverse
@@ -202,7 +282,182 @@ class EndgameSweepStrategy(TradingStrategy):
         # For now, return False (no manipulation detected)
         return False
 
-    def find_opportunities(self) -> List[Dict[str, Any]]:
+    def detect_manipulation_signals_batch(self, markets: List[dict]) -> Dict[str, bool]:
+        """
+        Detect manipulation signals for many markets.
+
+        Args:
+            markets: Market dictionaries from API
+
+        Returns:
+            Dictionary mapping market id to whether manipulation was detected
+        """
+        return {
+            market.get('id', 'unknown'): self.detect_manipulation_signals(market)
+            for market in markets
+        }
+
+    def _enrich_market(self, market: dict, hours_to_settlement: float) -> Optional[float]:
+        """
+        Run the per-market black swan check.
+
+        Args:
+            market: Market dictionary from API
+            hours_to_settlement: Hours to settlement from the vectorized prefilter
+
+        Returns:
+            Black swan risk score, or None on error
+        """
+        try:
+            return self.calculate_black_swan_risk(market, float(hours_to_settlement))
+        except Exception as e:
+            self.logger.debug(f"  ✗ Error analyzing market {market.get('id', 'unknown')}: {e}")
+            return None
+
+    def _market_end_ts(self, market: dict) -> float:
+        """
+        Return the market's end date as epoch seconds.
+
+        Args:
+            market: Market dictionary from API
+
+        Returns:
+            End date in epoch seconds, or NaN if missing or unparseable
+        """
+        end_date_str = market.get('endDate') or market.get('end_date_iso')
+        if not end_date_str:
+            return np.nan
+
+        try:
+            return self._end_ts(end_date_str)
+        except Exception as e:
+            market_id = market.get('id', 'unknown')
+            self.logger.debug(f"Error parsing end date for {market_id}: {e}")
+            return np.nan
+
+    def _parse_binary_markets(
+        self,
+        markets: Iterable[dict],
+        stats: Dict[str, int]
+    ) -> Tuple[List[dict], np.ndarray, np.ndarray]:
+        """
+        Extract YES/NO prices and end dates for binary markets.
+
+        Args:
+            markets: Market dictionaries from Gamma API, consumed as they arrive
+            stats: Scan statistics, updated with total and non-binary counts
+
+        Returns:
+            (binary markets, (N, 2) YES/NO price matrix, end epoch seconds)
+            with aligned rows
+        """
+        binary_markets = []
+        price_pairs = []
+        end_ts = []
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        for market in markets:
+            stats['total_markets'] += 1
+            market_id = market.get('id', 'unknown')
+            try:
+                # Check if market is binary (has clear YES/NO)
+                # outcomePrices is a STRINGIFIED JSON list from the API
+                outcome_prices_str = market.get('outcomePrices')
+
+                if not outcome_prices_str:
+                    stats['not_binary'] += 1
+                    if debug:
+                        self.logger.debug(f"  ✗ {str(market_id)[:10]}... no outcomePrices field (probably not funded)")
+                    continue
+
+                # Parse the JSON string into a list
+                try:
+                    outcome_prices = json.loads(outcome_prices_str)
+                except (ValueError, json.JSONDecodeError) as e:
+                    stats['not_binary'] += 1
+                    if debug:
+                        self.logger.debug(f"  ✗ {str(market_id)[:10]}... failed to parse outcomePrices: {e}")
+                    continue
+
+                if not outcome_prices or len(outcome_prices) != 2:
+                    stats['not_binary'] += 1
+                    if debug:
+                        self.logger.debug(f"  ✗ {str(market_id)[:10]}... not binary (has {len(outcome_prices)} outcomes)")
+                    continue
+
+            except Exception as e:
+                self.logger.debug(f"  ✗ Error analyzing market {market_id}: {e}")
+                continue
+
+            binary_markets.append(market)
+            price_pairs.append(outcome_prices)
+            end_ts.append(self._market_end_ts(market))
+
+        # Convert all price strings in one pass; only fall back to per-market
+        # conversion when some market has a malformed price
+        try:
+            prices = np.array(price_pairs, dtype=np.float64).reshape(-1, 2)
+        except (TypeError, ValueError):
+            keep = []
+            for i, (market, pair) in enumerate(zip(binary_markets, price_pairs)):
+                try:
+                    price_pairs[i] = (float(pair[0]), float(pair[1]))
+                    keep.append(i)
+                except Exception as e:
+                    self.logger.debug(f"  ✗ Error analyzing market {market.get('id', 'unknown')}: {e}")
+            binary_markets = [binary_markets[i] for i in keep]
+            prices = np.array([price_pairs[i] for i in keep], dtype=np.float64).reshape(-1, 2)
+            end_ts = [end_ts[i] for i in keep]
+
+        return binary_markets, prices, np.array(end_ts, dtype=np.float64)
+
+    def _build_opportunity(
+        self,
+        market_id: str,
+        market_question: str,
+        side: str,
+        price: float,
+        black_swan_risk: float
+    ) -> EndgameOpportunity:
+        """
+        Build an opportunity for one side of a market that passed all filters.
+
+        Args:
+            market_id: Market identifier
+            market_question: Market question text
+            side: "YES" or "NO"
+            price: Entry price for the side
+            black_swan_risk: Black swan risk score for the market
+
+        Returns:
+            Endgame opportunity
+        """
+        # Calculate expected profit
+        expected_profit_pct = ((1.0 - price) / price) * 100
+
+        # Calculate confidence (inverse of black swan risk)
+        confidence = 1.0 - black_swan_risk
+
+        opportunity = EndgameOpportunity(
+            market_id=market_id,
+            market_question=market_question,
+            side=side,
+            entry_price=price,
+            confidence=confidence,
+            expected_profit_pct=expected_profit_pct,
+            black_swan_risk=black_swan_risk,
+            reasoning=(
+                f"Endgame sweep: {side} @ ${price:.3f}, "
+                f"expected profit {expected_profit_pct:.2f}%, "
+                f"confidence {confidence:.0%}"
+            )
+        )
+        self.logger.info(
+            f"    ✓✓ OPPORTUNITY: {market_id} - {opportunity.reasoning}"
+        )
+        return opportunity
+
+    def find_opportunities(self) -> List[EndgameOpportunity]:
         """
         Scan markets for endgame sweep opportunities.
 
@@ -217,6 +472,9 @@ class EndgameSweepStrategy(TradingStrategy):
 
         opportunities = []
 
+        # Format per-market debug messages only when they will be emitted
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Track filter statistics
         stats = {
             'total_markets': 0,
@@ -225,176 +483,124 @@ class EndgameSweepStrategy(TradingStrategy):
             'not_near_settlement': 0,
             'low_confidence': 0,
             'manipulation_detected': 0,
+            'already_open': 0,
             'passed_filters': 0
         }
 
         try:
-            # Get all tradeable markets
-            markets = self.polymarket.get_all_tradeable_markets()
-            stats['total_markets'] = len(markets)
-            self.logger.info(f"Scanning {len(markets)} tradeable markets")
-
-            for market in markets:
-                try:
-                    # Markets are returned as dictionaries from Gamma API
-                    market_id = market.get('id', 'unknown')
-                    market_question = market.get('question', 'Unknown question')
-
-                    # Check if market is binary (has clear YES/NO)
-                    # outcomePrices is a STRINGIFIED JSON list from the API
-                    outcome_prices_str = market.get('outcomePrices')
-
-                    if not outcome_prices_str:
-                        stats['not_binary'] += 1
-                        self.logger.debug(f"  ✗ {str(market_id)[:10]}... no outcomePrices field (probably not funded)")
-                        continue
+            # Parse each page of tradeable markets while the next one is being
+            # fetched, then run the numeric price and settlement filters over
+            # whole arrays so only markets with a tradeable side reach the
+            # per-market checks
+            markets = chain.from_iterable(self.polymarket.iter_tradeable_market_pages())
+            binary_markets, prices, end_ts = self._parse_binary_markets(markets, stats)
+            yes_prices, no_prices = prices[:, 0], prices[:, 1]
+            self.logger.info(f"Scanning {stats['total_markets']} tradeable markets")
+            hours_to_settlement = (end_ts - time.time()) / 3600
+            # NaN (no parseable end date) compares False, i.e. not near settlement
+            near_settlement = hours_to_settlement <= self.max_hours_to_settlement
+            yes_in_range = (yes_prices >= self.min_price) & (yes_prices <= self.max_price)
+            no_in_range = (no_prices >= self.min_price) & (no_prices <= self.max_price)
+            candidates = np.flatnonzero((yes_in_range | no_in_range) & near_settlement)
+
+            # Filter counts are per side, matching the per-side checks below
+            stats['price_out_of_range'] += int(np.count_nonzero(~yes_in_range) + np.count_nonzero(~no_in_range))
+            stats['not_near_settlement'] += int(
+                np.count_nonzero(yes_in_range & ~near_settlement)
+                + np.count_nonzero(no_in_range & ~near_settlement)
+            )
+            if debug:
+                self.logger.debug(
+                    f"  → {len(candidates)} of {len(binary_markets)} binary markets "
+                    f"in price range and within {self.max_hours_to_settlement}h of settlement"
+                )
 
-                    # Parse the JSON string into a list
-                    try:
-                        outcome_prices = json.loads(outcome_prices_str)
-                    except (ValueError, json.JSONDecodeError) as e:
-                        stats['not_binary'] += 1
-                        self.logger.debug(f"  ✗ {str(market_id)[:10]}... failed to parse outcomePrices: {e}")
-                        continue
+            # Risk checks may hit external services, so run them concurrently
+            # for all candidates before building opportunities
+            candidate_markets = [binary_markets[i] for i in candidates]
+            risks = []
+            manipulation_flags = {}
+            if candidate_markets:
+                max_workers = min(config.ENDGAME_ENRICH_MAX_WORKERS, len(candidate_markets))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    risks = list(executor.map(
+                        self._enrich_market, candidate_markets, hours_to_settlement[candidates]
+                    ))
+
+                # One batched on-chain lookup for every candidate
+                manipulation_flags = self.detect_manipulation_signals_batch(candidate_markets)
+
+            # Resolve every (market, side) pair with one combined mask, so
+            # Python only builds opportunities for the pairs that pass.
+            # Markets whose risk check failed are dropped without counting.
+            black_swan_risk = np.array([np.nan if r is None else r for r in risks], dtype=np.float64)
+            analyzed = ~np.isnan(black_swan_risk)
+            manipulated = np.array(
+                [manipulation_flags.get(m.get('id', 'unknown'), False) for m in candidate_markets],
+                dtype=bool
+            ) & analyzed
+            side_in_range = np.stack([yes_in_range, no_in_range], axis=1)[candidates]
+            # Manipulation rules out the whole market, not just one side
+            tradeable = side_in_range & (analyzed & ~manipulated)[:, None]
+            confident = (1.0 - black_swan_risk) >= self.min_confidence
+            passed = tradeable & confident[:, None]
+
+            stats['manipulation_detected'] += int(np.count_nonzero(manipulated))
+            stats['low_confidence'] += int(np.count_nonzero(tradeable & ~confident[:, None]))
+            for k in np.flatnonzero(manipulated):
+                self.logger.warning(
+                    f"    ✗ Manipulation detected in {candidate_markets[k].get('id', 'unknown')}, skipping"
+                )
+            if debug:
+                self.logger.debug(
+                    f"  → {np.count_nonzero(passed)} of {np.count_nonzero(side_in_range)} "
+                    f"in-range sides passed risk and manipulation checks"
+                )
 
-                    if not outcome_prices or len(outcome_prices) != 2:
-                        stats['not_binary'] += 1
-                        self.logger.debug(f"  ✗ {str(market_id)[:10]}... not binary (has {len(outcome_prices)} outcomes)")
-                        continue
-
-                    # Get YES and NO prices
-                    yes_price = float(outcome_prices[0])
-                    no_price = float(outcome_prices[1])
-
-                    self.logger.debug(f"  → {market_id[:10]}... YES={yes_price:.3f}, NO={no_price:.3f}: {market_question[:50]}...")
-
-                    # Track if this market passes any checks
-                    market_checked = False
-
-                    # Check YES side
-                    if self.min_price <= yes_price <= self.max_price:
-                        self.logger.debug(f"    YES price in range [{self.min_price}, {self.max_price}]")
-                        market_checked = True
-
-                        if self.is_near_settlement(market):
-                            self.logger.debug(f"    ✓ Near settlement (< {self.max_hours_to_settlement}h)")
-
-                            # Calculate expected profit
-                            expected_profit_pct = ((1.0 - yes_price) / yes_price) * 100
-
-                            # Check black swan risk
-                            black_swan_risk = self.calculate_black_swan_risk(market)
-                            self.logger.debug(f"    Black swan risk: {black_swan_risk:.2f}")
-
-                            # Check for manipulation
-                            manipulation_detected = self.detect_manipulation_signals(market)
-
-                            if manipulation_detected:
-                                stats['manipulation_detected'] += 1
-                                self.logger.warning(
-                                    f"    ✗ Manipulation detected in {market_id}, skipping"
-                                )
-                                continue
-
-                            # Calculate confidence (inverse of black swan risk)
-                            confidence = 1.0 - black_swan_risk
-
-                            # Only proceed if confidence is high enough
-                            if confidence >= self.min_confidence:
-                                stats['passed_filters'] += 1
-                                opportunity = {
-                                    "market_id": market_id,
-                                    "market_question": market_question,
-                                    "side": "YES",
-                                    "entry_price": yes_price,
-                                    "confidence": confidence,
-                                    "expected_profit_pct": expected_profit_pct,
-                                    "black_swan_risk": black_swan_risk,
-                                    "reasoning": (
-                                        f"Endgame sweep: YES @ ${yes_price:.3f}, "
-                                        f"expected profit {expected_profit_pct:.2f}%, "
-                                        f"confidence {confidence:.0%}"
-                                    )
-                                }
-                                opportunities.append(opportunity)
-                                self.logger.info(
-                                    f"    ✓✓ OPPORTUNITY: {market_id} - {opportunity['reasoning']}"
-                                )
-                            else:
-                                stats['low_confidence'] += 1
-                                self.logger.debug(f"    ✗ Confidence too low: {confidence:.2f} < {self.min_confidence}")
-                        else:
-                            stats['not_near_settlement'] += 1
-                            self.logger.debug(f"    ✗ Not near settlement (> {self.max_hours_to_settlement}h)")
-                    elif yes_price > self.max_price:
-                        stats['price_out_of_range'] += 1
-                        self.logger.debug(f"    ✗ YES price too high: {yes_price:.3f} > {self.max_price}")
-                        market_checked = True
-                    elif yes_price < self.min_price:
-                        stats['price_out_of_range'] += 1
-                        self.logger.debug(f"    ✗ YES price too low: {yes_price:.3f} < {self.min_price}")
-                        market_checked = True
-
-                    # Check NO side
-                    if self.min_price <= no_price <= self.max_price:
-                        self.logger.debug(f"    NO price in range [{self.min_price}, {self.max_price}]")
-                        market_checked = True
-                        if self.is_near_settlement(market):
-                            self.logger.debug(f"    ✓ Near settlement (< {self.max_hours_to_settlement}h)")
-                            expected_profit_pct = ((1.0 - no_price) / no_price) * 100
-                            black_swan_risk = self.calculate_black_swan_risk(market)
-                            self.logger.debug(f"    Black swan risk: {black_swan_risk:.2f}")
-                            manipulation_detected = self.detect_manipulation_signals(market)
-
-                            if manipulation_detected:
-                                stats['manipulation_detected'] += 1
-                                self.logger.warning(f"    ✗ Manipulation detected in {market_id}, skipping")
-                                continue
-
-                            confidence = 1.0 - black_swan_risk
-
-                            if confidence >= self.min_confidence:
-                                stats['passed_filters'] += 1
-                                opportunity = {
-                                    "market_id": market_id,
-                                    "market_question": market_question,
-                                    "side": "NO",
-                                    "entry_price": no_price,
-                                    "confidence": confidence,
-                                    "expected_profit_pct": expected_profit_pct,
-                                    "black_swan_risk": black_swan_risk,
-                                    "reasoning": (
-                                        f"Endgame sweep: NO @ ${no_price:.3f}, "
-                                        f"expected profit {expected_profit_pct:.2f}%, "
-                                        f"confidence {confidence:.0%}"
-                                    )
-                                }
-                                opportunities.append(opportunity)
-                                self.logger.info(
-                                    f"    ✓✓ OPPORTUNITY: {market_id} - {opportunity['reasoning']}"
-                                )
-                            else:
-                                stats['low_confidence'] += 1
-                                self.logger.debug(f"    ✗ Confidence too low: {confidence:.2f} < {self.min_confidence}")
-                        else:
-                            stats['not_near_settlement'] += 1
-                            self.logger.debug(f"    ✗ Not near settlement (> {self.max_hours_to_settlement}h)")
-                    elif no_price > self.max_price:
-                        stats['price_out_of_range'] += 1
-                        self.logger.debug(f"    ✗ NO price too high: {no_price:.3f} > {self.max_price}")
-                        market_checked = True
-                    elif no_price < self.min_price:
-                        stats['price_out_of_range'] += 1
-                        self.logger.debug(f"    ✗ NO price too low: {no_price:.3f} < {self.min_price}")
-                        market_checked = True
-
-                    # If neither YES nor NO was in range, log it
-                    if not market_checked:
-                        self.logger.debug(f"    ✗ Both prices out of range")
+            # Skip sides we already hold so they are not re-executed every scan
+            try:
+                open_keys = db.get_open_trade_keys()
+            except Exception as e:
+                self.logger.warning(f"Could not load open trades, not deduplicating: {e}")
+                open_keys = set()
 
-                except Exception as e:
-                    self.logger.debug(f"  ✗ Error analyzing market {market_id}: {e}")
-                    continue
+            # Drop sides we already hold, then keep only the best sides. Expected
+            # profit falls as price rises, so a stable ascending sort on price
+            # ranks sides by profit (ties in scan order, YES before NO) and
+            # opportunities are only built for the top few.
+            max_opportunities = 10
+            pair_k, pair_side = np.nonzero(passed)
+            not_open = np.array([
+                (candidate_markets[k].get('id', 'unknown'), ("YES", "NO")[side_idx]) not in open_keys
+                for k, side_idx in zip(pair_k, pair_side)
+            ], dtype=bool)
+            stats['already_open'] += int(len(not_open) - np.count_nonzero(not_open))
+            pair_k, pair_side = pair_k[not_open], pair_side[not_open]
+            stats['passed_filters'] += len(pair_k)
+
+            pair_prices = prices[candidates][pair_k, pair_side]
+            for p in np.argsort(pair_prices, kind='stable')[:max_opportunities]:
+                k, side_idx = pair_k[p], pair_side[p]
+                market = candidate_markets[k]
+                opportunities.append(self._build_opportunity(
+                    market.get('id', 'unknown'),
+                    market.get('question', 'Unknown question'),
+                    ("YES", "NO")[side_idx],
+                    float(pair_prices[p]),
+                    float(black_swan_risk[k])
+                ))
+
+            # Size the selected sides in one vectorized pass (one balance
+            # lookup); a zero size would only fail trade validation later
+            if opportunities:
+                sizes = self.risk_manager.calculate_position_sizes(
+                    np.array([opp.confidence for opp in opportunities])
+                )
+                opportunities = [
+                    opp._replace(position_size_usd=size)
+                    for opp, size in zip(opportunities, sizes.tolist())
+                    if size > 0
+                ]
 
             # Log statistics summary
             self.logger.info("=" * 70)
@@ -406,46 +612,45 @@ class EndgameSweepStrategy(TradingStrategy):
             self.logger.info(f"  ✗ Not near settlement: {stats['not_near_settlement']}")
             self.logger.info(f"  ✗ Low confidence: {stats['low_confidence']}")
             self.logger.info(f"  ✗ Manipulation detected: {stats['manipulation_detected']}")
+            self.logger.info(f"  ✗ Already open: {stats['already_open']}")
             self.logger.info(f"  ✓ Passed all filters: {stats['passed_filters']}")
-            self.logger.info(f"\nFound {len(opportunities)} endgame sweep opportunities")
-
-            # Sort by expected profit (highest first)
-            opportunities.sort(key=lambda x: x['expected_profit_pct'], reverse=True)
+            self.logger.info(f"\nFound {stats['passed_filters']} endgame sweep opportunities")
 
             # Limit to top opportunities to avoid overexposure
-            max_opportunities = 10
-            if len(opportunities) > max_opportunities:
+            if stats['passed_filters'] > max_opportunities:
                 self.logger.info(f"Limiting to top {max_opportunities} opportunities")
-                opportunities = opportunities[:max_opportunities]
 
+            # Already ordered by expected profit (highest first)
             return opportunities
 
         except Exception as e:
             self.logger.error(f"Error finding opportunities: {e}", exc_info=True)
             return []
 
-    def execute_opportunity(self, opportunity: Dict[str, Any]) -> Optional[Trade]:
+    def execute_opportunity(self, opportunity: EndgameOpportunity) -> Optional[Trade]:
         """
         Execute an endgame sweep trade.
 
         Args:
-            opportunity: Opportunity dictionary
+            opportunity: Opportunity from find_opportunities()
 
         Returns:
             Trade object if executed, None otherwise
         """
-        market_id = opportunity['market_id']
-        self.logger.info(f"Attempting to execute: {opportunity['reasoning']}")
+        market_id = opportunity.market_id
+        self.logger.info(f"Attempting to execute: {opportunity.reasoning}")
 
         try:
-            # Calculate position size
-            position_size = self.risk_manager.calculate_position_size(
-                confidence=opportunity['confidence'],
-                expected_profit_pct=opportunity['expected_profit_pct']
-            )
+            # Position size, computed for the whole scan in find_opportunities
+            position_size = opportunity.position_size_usd
+            if position_size is None:
+                position_size = self.risk_manager.calculate_position_size(
+                    confidence=opportunity.confidence,
+                    expected_profit_pct=opportunity.expected_profit_pct
+                )
 
             # Estimate expected profit in dollars
-            expected_profit_usd = position_size * (opportunity['expected_profit_pct'] / 100)
+            expected_profit_usd = position_size * (opportunity.expected_profit_pct / 100)
 
             # Validate trade with risk manager
             is_valid, errors = self.risk_manager.validate_trade(
@@ -465,20 +670,20 @@ class EndgameSweepStrategy(TradingStrategy):
             if config.PAPER_TRADING_MODE:
                 self.logger.info(
                     f"PAPER TRADE: Would buy {position_size:.2f} USDC of "
-                    f"{opportunity['side']} @ {opportunity['entry_price']:.3f}"
+                    f"{opportunity.side} @ {opportunity.entry_price:.3f}"
                 )
 
                 # Record in database as paper trade
                 trade = db.add_trade(
                     market_id=market_id,
-                    market_question=opportunity['market_question'],
+                    market_question=opportunity.market_question,
                     strategy=self.name,
-                    side=opportunity['side'],
-                    entry_price=opportunity['entry_price'],
+                    side=opportunity.side,
+                    entry_price=opportunity.entry_price,
                     size_usd=position_size,
                     paper_trade=True,
-                    confidence_score=opportunity['confidence'],
-                    notes=opportunity['reasoning']
+                    confidence_score=opportunity.confidence,
+                    notes=opportunity.reasoning
                 )
 
                 self.logger.info(f"Paper trade recorded: Trade #{trade.id}")
@@ -488,7 +693,7 @@ class EndgameSweepStrategy(TradingStrategy):
             else:
                 self.logger.info(
                     f"LIVE TRADE: Buying {position_size:.2f} USDC of "
-                    f"{opportunity['side']} @ {opportunity['entry_price']:.3f}"
+                    f"{opportunity.side} @ {opportunity.entry_price:.3f}"
                 )
 
                 # TODO: Execute actual trade via Polymarket client
@@ -537,7 +742,7 @@ if __name__ == "__main__":
 
     print(f"\nFound {len(opportunities)} opportunities:")
     for i, opp in enumerate(opportunities, 1):
-        print(f"{i}. {opp['reasoning']}")
+        print(f"{i}. {opp.reasoning}")
 
     # Test execution (paper trading)
     if opportunities:
@@ -24,11 +24,15 @@ Whale Quality Factors:
 - Risk Management (10%): Max drawdown and position sizing
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+import numpy as np
+from cachetools import TTLCache
+
 from agents.application.strategy_manager import TradingStrategy
 from agents.application.risk_manager import RiskManager
 from agents.utils.config import config
@@ -46,6 +50,75 @@ except (ImportError, ModuleNotFoundError):
 
 logger = logging.getLogger(__name__)
 
+# Market lookups are shared by every signal in a scan; keep them briefly
+MARKET_CACHE_TTL_SECONDS = 5.0
+MARKET_CACHE_MAX_SIZE = 512
+MARKET_PREFETCH_MAX_WORKERS = 16
+
+# Share of full Kelly to bet, and cap as a share of the whale's own position
+KELLY_FRACTIONAL = 0.25
+WHALE_SIZE_CAP = 0.5
+
+
+class WhaleOpportunity(NamedTuple):
+    """A copyable whale signal that passed all whale following filters."""
+
+    signal_id: int
+    whale_address: str
+    whale_nickname: str
+    whale_quality: float
+    whale_type: str
+    signal_type: str
+    market_id: str
+    market_question: str
+    side: str
+    whale_entry_price: float
+    current_price: float
+    whale_position_size_usd: float
+    confidence: float
+    expected_profit_pct: float
+    signal_age_seconds: float
+    position_size_usd: Optional[float] = None
+
+    @property
+    def reasoning(self) -> str:
+        """Human-readable summary, formatted on access for logs and trade notes."""
+        return (
+            f"Copy {self.whale_type} whale {self.whale_nickname}...: "
+            f"{self.signal_type} {self.side} @ ${self.current_price:.3f} "
+            f"(quality: {self.whale_quality:.2f})"
+        )
+
+
+def kelly_sizes(
+    qualities: np.ndarray,
+    whale_sizes: np.ndarray,
+    bankroll: float,
+    max_fraction: float,
+    fractional: float = KELLY_FRACTIONAL
+) -> np.ndarray:
+    """
+    Fractional Kelly position sizes for a batch of whale signals.
+
+    Kelly fraction with 1:1 odds is p - q, using whale quality as p. The
+    scaled fraction is clipped to [0, max_fraction] of bankroll and each
+    size is capped at half the whale's own position.
+
+    Args:
+        qualities: Whale quality scores (0-1)
+        whale_sizes: Whale position sizes in USD
+        bankroll: Current bankroll in USD
+        max_fraction: Maximum fraction of bankroll per position
+        fractional: Share of full Kelly to use
+
+    Returns:
+        Position sizes in USD
+    """
+    qualities = np.asarray(qualities, dtype=np.float64)
+    fractions = (qualities - (1.0 - qualities)) * fractional
+    np.clip(fractions, 0.0, max_fraction, out=fractions)
+    return np.minimum(fractions * bankroll, np.asarray(whale_sizes, dtype=np.float64) * WHALE_SIZE_CAP)
+
 
 class WhaleFollowingStrategy(TradingStrategy):
     """
@@ -83,6 +156,12 @@ class WhaleFollowingStrategy(TradingStrategy):
         self.min_whale_quality = min_whale_quality or config.WHALE_MIN_QUALITY_SCORE
         self.copy_delay_seconds = copy_delay_seconds or config.WHALE_COPY_DELAY_SECONDS
         self.max_position_pct = max_position_pct or config.WHALE_MAX_POSITION_PCT
+        self._max_position_frac = self.max_position_pct / 100
+
+        # market_id -> market (None on failure), expiring after MARKET_CACHE_TTL_SECONDS
+        self._market_cache: TTLCache = TTLCache(
+            maxsize=MARKET_CACHE_MAX_SIZE, ttl=MARKET_CACHE_TTL_SECONDS
+        )
 
         self.logger.info(
             f"Whale Following initialized: "
@@ -123,36 +202,77 @@ class WhaleFollowingStrategy(TradingStrategy):
         Returns:
             Position size in USD
         """
-        # Use whale quality as win probability
-        p = whale_quality
-        q = 1 - p
-        b = 1.0  # Assume 1:1 odds for prediction markets
+        # No edge at even odds: Kelly would clip to zero anyway
+        if whale_quality <= 0.5:
+            return 0.0
+
+        # Scalar form of kelly_sizes; avoids building arrays for one signal
+        fraction = min((whale_quality - (1.0 - whale_quality)) * KELLY_FRACTIONAL, self._max_position_frac)
+        max_copy_size = min(fraction * bankroll, whale_position_size_usd * WHALE_SIZE_CAP)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Kelly calculation: quality={whale_quality:.2f}, "
+                f"bankroll=${bankroll:.2f}, "
+                f"capped=${max_copy_size:.2f}"
+            )
 
-        # Kelly fraction
-        kelly_fraction = (p * b - q) / b
+        return max_copy_size
 
-        # Apply fractional Kelly (use 25% of full Kelly to reduce risk)
-        fractional_kelly = 0.25
-        position_fraction = kelly_fraction * fractional_kelly
+    def _fetch_market(self, market_id: str) -> Optional[SimpleMarket]:
+        """
+        Fetch a market from Polymarket, logging and swallowing errors.
 
-        # Ensure position fraction is positive and within limits
-        position_fraction = max(0, min(position_fraction, self.max_position_pct / 100))
+        Args:
+            market_id: Market ID
 
-        # Calculate position size
-        position_size = bankroll * position_fraction
+        Returns:
+            Market, or None if it could not be fetched
+        """
+        try:
+            return self.polymarket.get_market(market_id)
+        except Exception as e:
+            self.logger.warning(f"Could not get market {market_id}: {e}")
+            return None
 
-        # Cap at whale's position size (never bet more than the whale)
-        # Scale down if our bankroll allows larger positions
-        max_copy_size = min(position_size, whale_position_size_usd * 0.5)  # Max 50% of whale size
+    def _prefetch_markets(self, market_ids: Iterable[str]) -> Dict[str, Optional[SimpleMarket]]:
+        """
+        Fetch all markets that are not freshly cached, concurrently.
 
-        self.logger.debug(
-            f"Kelly calculation: quality={whale_quality:.2f}, "
-            f"kelly_fraction={kelly_fraction:.3f}, "
-            f"position_size=${position_size:.2f}, "
-            f"capped=${max_copy_size:.2f}"
-        )
+        Args:
+            market_ids: Market IDs needed for this scan
 
-        return max_copy_size
+        Returns:
+            Dictionary of market_id -> market (None if it could not be fetched)
+        """
+        markets = {}
+        missing = []
+        for market_id in set(market_ids):
+            try:
+                markets[market_id] = self._market_cache[market_id]
+            except KeyError:
+                missing.append(market_id)
+
+        if missing:
+            max_workers = min(MARKET_PREFETCH_MAX_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for market_id, market in zip(missing, executor.map(self._fetch_market, missing)):
+                    self._market_cache[market_id] = market
+                    markets[market_id] = market
+
+        return markets
+
+    def _get_market(self, market_id: str) -> Optional[SimpleMarket]:
+        """
+        Get a market, from the scan cache when it is fresh.
+
+        Args:
+            market_id: Market ID
+
+        Returns:
+            Market, or None if it could not be fetched
+        """
+        return self._prefetch_markets((market_id,))[market_id]
 
     def get_current_market_price(self, market_id: str, side: str) -> Optional[float]:
         """
@@ -166,52 +286,68 @@ class WhaleFollowingStrategy(TradingStrategy):
             Current price or None if not available
         """
         try:
-            market = self.polymarket.get_market(market_id)
-            if not market or not hasattr(market, 'outcome_prices'):
+            # A missing market (None) has no prices either
+            prices = getattr(self._get_market(market_id), 'outcome_prices', None)
+            if not prices:
                 return None
 
             # Assume outcome_prices[0] = YES, outcome_prices[1] = NO
             if side == "YES":
-                return market.outcome_prices[0] if len(market.outcome_prices) > 0 else None
+                return prices[0]
             elif side == "NO":
-                return market.outcome_prices[1] if len(market.outcome_prices) > 1 else None
+                return prices[1] if len(prices) > 1 else None
 
         except Exception as e:
             self.logger.warning(f"Could not get market price for {market_id}: {e}")
             return None
 
-    def should_skip_signal(self, signal: WhaleSignal) -> tuple[bool, Optional[str]]:
+    def should_skip_signal(
+        self,
+        signal: WhaleSignal,
+        active_trade_counts: Optional[Dict[str, int]] = None,
+        whale_price: Optional[float] = None
+    ) -> tuple[bool, Optional[str], Optional[float]]:
         """
         Check if signal should be skipped based on various criteria.
 
         Args:
             signal: WhaleSignal to evaluate
+            active_trade_counts: Open trade counts per market, prefetched for a
+                whole scan (queried for this signal's market if not provided)
+            whale_price: signal.price already converted to float (converted here
+                if not provided)
 
         Returns:
-            Tuple of (should_skip, reason)
+            Tuple of (should_skip, reason, current_price); current_price is None
+            if it was not looked up or is not available
         """
         # Check if we already have a position in this market
-        existing_trades = db.get_active_trades_for_market(signal.market_id)
+        if active_trade_counts is None:
+            active_trade_counts = db.get_active_trade_counts((signal.market_id,))
+        existing_trades = active_trade_counts.get(signal.market_id, 0)
         if existing_trades:
-            return True, f"Already have {len(existing_trades)} active position(s) in this market"
+            return True, f"Already have {existing_trades} active position(s) in this market", None
 
         # Check current market price vs whale's entry price
         current_price = self.get_current_market_price(signal.market_id, signal.side)
         if current_price is not None:
-            price_change_pct = abs((current_price - float(signal.price)) / float(signal.price)) * 100
+            if whale_price is None:
+                whale_price = float(signal.price)
 
-            # Skip if price has moved too much (>5%)
-            if price_change_pct > 5.0:
-                return True, f"Price moved {price_change_pct:.1f}% since whale entry"
+            # Skip if price has moved too much (>5%); the percentage is only
+            # computed for the skip reason
+            if current_price > whale_price * 1.05 or current_price < whale_price * 0.95:
+                price_change_pct = abs((current_price - whale_price) / whale_price) * 100
+                return True, f"Price moved {price_change_pct:.1f}% since whale entry", current_price
 
             # Skip if price is worse than whale's entry (slippage protection)
             if signal.signal_type == "ENTRY":
-                if current_price > float(signal.price) * 1.02:  # 2% slippage tolerance
-                    return True, f"Current price ${current_price:.3f} worse than whale's ${float(signal.price):.3f}"
+                if current_price > whale_price * 1.02:  # 2% slippage tolerance
+                    return True, f"Current price ${current_price:.3f} worse than whale's ${whale_price:.3f}", current_price
 
-        return False, None
+        return False, None, current_price
 
-    def find_opportunities(self) -> List[Dict[str, Any]]:
+    def find_opportunities(self) -> List[WhaleOpportunity]:
         """
         Find copyable whale signals ready for execution.
 
@@ -223,53 +359,86 @@ class WhaleFollowingStrategy(TradingStrategy):
 
         opportunities = []
 
+        # Format per-signal debug messages only when they will be emitted
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Track filter statistics
         stats = {
             'total_signals': 0,
-            'whale_not_found': 0,
             'skipped': 0,
             'no_price': 0,
             'passed_filters': 0
         }
 
+        # Conservative limit to avoid overexposure
+        max_opportunities = 5
+
+        # (signal_id, reason) for skipped signals, written in one transaction
+        ignored: List[Tuple[int, str]] = []
+
         try:
-            # Get copyable signals (past delay period)
-            signals = self.signal_generator.get_copyable_signals(
-                copy_delay_seconds=self.copy_delay_seconds
+            # Signal ages are measured against one timestamp for the whole scan
+            now = datetime.utcnow()
+
+            # Copyable signals (past delay period) with their whales, highest
+            # quality first; whales below the quality threshold are filtered out
+            # by the query. Pages are read until enough opportunities are found.
+            pages = self.signal_generator.iter_copyable_signals_with_whales(
+                copy_delay_seconds=self.copy_delay_seconds,
+                min_quality=self.min_whale_quality
             )
 
-            stats['total_signals'] = len(signals)
-            self.logger.info(f"Found {len(signals)} copyable signals (delay: {self.copy_delay_seconds}s)")
+            for signal_whales in pages:
+                market_ids = [signal.market_id for signal, _ in signal_whales]
 
-            for signal in signals:
-                try:
-                    self.logger.debug(f"  → Signal #{signal.id}: {signal.signal_type} {signal.side} on {signal.market_id[:10]}...")
+                # One query for open positions across all markets in the page,
+                # run while every market in the page is fetched concurrently
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    counts_future = executor.submit(db.get_active_trade_counts, market_ids)
+                    markets = self._prefetch_markets(market_ids)
+                    active_trade_counts = counts_future.result()
 
-                    # Get whale info
-                    whale = self.whale_monitor.get_whale(signal.whale_address)
-                    if not whale:
-                        stats['whale_not_found'] += 1
-                        self.logger.warning(f"    ✗ Whale {signal.whale_address[:8]}... not found")
-                        continue
+                for signal, whale in signal_whales:
+                    if len(opportunities) >= max_opportunities:
+                        break
+
+                    stats['total_signals'] += 1
+
+                    if debug:
+                        self.logger.debug(f"  → Signal #{signal.id}: {signal.signal_type} {signal.side} on {signal.market_id[:10]}...")
 
-                    self.logger.debug(f"    Whale: {whale.nickname or signal.whale_address[:8]}..., quality: {whale.quality_score:.2f}")
+                    if debug:
+                        self.logger.debug(f"    Whale: {whale.nickname or signal.whale_address[:8]}..., quality: {whale.quality_score:.2f}")
+
+                    # Only the conversions and the skip check (DB/market lookups,
+                    # price arithmetic) can fail for a single bad signal
+                    try:
+                        # Convert the Decimal columns once per signal
+                        whale_price = float(signal.price)
+                        whale_size_usd = float(signal.size_usd)
+
+                        # Check if signal should be skipped
+                        should_skip, skip_reason, current_price = self.should_skip_signal(
+                            signal, active_trade_counts, whale_price
+                        )
+                    except Exception as e:
+                        self.logger.error(f"  ✗ Error processing signal #{signal.id}: {e}", exc_info=True)
+                        continue
 
-                    # Check if signal should be skipped
-                    should_skip, skip_reason = self.should_skip_signal(signal)
                     if should_skip:
                         stats['skipped'] += 1
                         self.logger.info(f"    ✗ Skipped: {skip_reason}")
-                        self.signal_generator.mark_signal_ignored(signal.id, skip_reason)
+                        ignored.append((signal.id, skip_reason))
                         continue
 
-                    # Get current market info
-                    current_price = self.get_current_market_price(signal.market_id, signal.side)
+                    # Current price was already looked up by should_skip_signal
                     if current_price is None:
                         stats['no_price'] += 1
                         self.logger.warning(f"    ✗ Could not get current price for {signal.market_id}")
                         continue
 
-                    self.logger.debug(f"    Current price: {current_price:.3f}, Whale entry: {float(signal.price):.3f}")
+                    if debug:
+                        self.logger.debug(f"    Current price: {current_price:.3f}, Whale entry: {whale_price:.3f}")
 
                     # Calculate expected profit
                     if signal.signal_type == "ENTRY":
@@ -279,58 +448,64 @@ class WhaleFollowingStrategy(TradingStrategy):
                         expected_profit_pct = 0
 
                     # Create opportunity
-                    opportunity = {
-                        "signal_id": signal.id,
-                        "whale_address": signal.whale_address,
-                        "whale_nickname": whale.nickname or signal.whale_address[:8],
-                        "whale_quality": whale.quality_score,
-                        "whale_type": whale.whale_type,
-                        "signal_type": signal.signal_type,
-                        "market_id": signal.market_id,
-                        "side": signal.side,
-                        "whale_entry_price": float(signal.price),
-                        "current_price": current_price,
-                        "whale_position_size_usd": float(signal.size_usd),
-                        "confidence": signal.confidence,
-                        "expected_profit_pct": expected_profit_pct,
-                        "signal_age_seconds": (datetime.utcnow() - signal.created_at).total_seconds(),
-                        "reasoning": (
-                            f"Copy {whale.whale_type} whale {whale.nickname or signal.whale_address[:8]}...: "
-                            f"{signal.signal_type} {signal.side} @ ${current_price:.3f} "
-                            f"(quality: {whale.quality_score:.2f})"
-                        )
-                    }
+                    opportunity = WhaleOpportunity(
+                        signal_id=signal.id,
+                        whale_address=signal.whale_address,
+                        whale_nickname=whale.nickname or signal.whale_address[:8],
+                        whale_quality=whale.quality_score,
+                        whale_type=whale.whale_type,
+                        signal_type=signal.signal_type,
+                        market_id=signal.market_id,
+                        market_question=getattr(markets.get(signal.market_id), 'question', None) or 'Unknown',
+                        side=signal.side,
+                        whale_entry_price=whale_price,
+                        current_price=current_price,
+                        whale_position_size_usd=whale_size_usd,
+                        confidence=signal.confidence,
+                        expected_profit_pct=expected_profit_pct,
+                        signal_age_seconds=(now - signal.created_at).total_seconds()
+                    )
 
                     stats['passed_filters'] += 1
                     opportunities.append(opportunity)
 
-                    self.logger.info(
-                        f"    ✓✓ OPPORTUNITY: Signal #{signal.id} - {opportunity['reasoning']}"
-                    )
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(
+                            f"    ✓✓ OPPORTUNITY: Signal #{signal.id} - {opportunity.reasoning}"
+                        )
 
-                except Exception as e:
-                    self.logger.error(f"  ✗ Error processing signal #{signal.id}: {e}", exc_info=True)
-                    continue
+                # Stop before reading another page once the limit is reached
+                if len(opportunities) >= max_opportunities:
+                    break
+
+            # A failed status update must not discard the opportunities found
+            try:
+                self.signal_generator.mark_signals_ignored(ignored)
+            except Exception as e:
+                self.logger.error(f"Error marking {len(ignored)} signals as ignored: {e}")
 
             # Log statistics summary
             self.logger.info("=" * 70)
             self.logger.info("WHALE FOLLOWING SCAN COMPLETE")
             self.logger.info("=" * 70)
             self.logger.info(f"Total signals checked: {stats['total_signals']}")
-            self.logger.info(f"  ✗ Whale not found: {stats['whale_not_found']}")
             self.logger.info(f"  ✗ Skipped (already copied, quality, etc.): {stats['skipped']}")
             self.logger.info(f"  ✗ Could not get price: {stats['no_price']}")
             self.logger.info(f"  ✓ Passed all filters: {stats['passed_filters']}")
             self.logger.info(f"\nFound {len(opportunities)} whale following opportunities")
 
-            # Sort by whale quality (highest quality first)
-            opportunities.sort(key=lambda x: x['whale_quality'], reverse=True)
-
-            # Limit to top opportunities
-            max_opportunities = 5  # Conservative limit to avoid overexposure
-            if len(opportunities) > max_opportunities:
-                self.logger.info(f"Limiting to top {max_opportunities} opportunities")
-                opportunities = opportunities[:max_opportunities]
+            # Size every remaining opportunity in one vectorized Kelly pass
+            if opportunities:
+                sizes = kelly_sizes(
+                    np.array([opp.whale_quality for opp in opportunities]),
+                    np.array([opp.whale_position_size_usd for opp in opportunities]),
+                    self.risk_manager.get_available_capital(),
+                    self._max_position_frac
+                )
+                opportunities = [
+                    opp._replace(position_size_usd=size)
+                    for opp, size in zip(opportunities, sizes.tolist())
+                ]
 
             return opportunities
 
@@ -338,31 +513,31 @@ class WhaleFollowingStrategy(TradingStrategy):
             self.logger.error(f"Error finding whale opportunities: {e}", exc_info=True)
             return []
 
-    def execute_opportunity(self, opportunity: Dict[str, Any]) -> Optional[Trade]:
+    def execute_opportunity(self, opportunity: WhaleOpportunity) -> Optional[Trade]:
         """
         Execute a whale following trade.
 
         Args:
-            opportunity: Opportunity dictionary from find_opportunities()
+            opportunity: Opportunity from find_opportunities()
 
         Returns:
             Trade object if executed, None otherwise
         """
-        signal_id = opportunity['signal_id']
-        market_id = opportunity['market_id']
+        signal_id = opportunity.signal_id
+        market_id = opportunity.market_id
 
-        self.logger.info(f"Attempting to execute: {opportunity['reasoning']}")
+        self.logger.info(f"Attempting to execute: {opportunity.reasoning}")
 
         try:
-            # Get current bankroll
-            bankroll = self.risk_manager.get_available_capital()
-
-            # Calculate position size using Kelly Criterion
-            position_size = self.calculate_kelly_position_size(
-                whale_quality=opportunity['whale_quality'],
-                whale_position_size_usd=opportunity['whale_position_size_usd'],
-                bankroll=bankroll
-            )
+            # Kelly position size, computed for the whole scan in find_opportunities;
+            # validate_trade below re-checks it against current capital
+            position_size = opportunity.position_size_usd
+            if position_size is None:
+                position_size = self.calculate_kelly_position_size(
+                    whale_quality=opportunity.whale_quality,
+                    whale_position_size_usd=opportunity.whale_position_size_usd,
+                    bankroll=self.risk_manager.get_available_capital()
+                )
 
             # Ensure minimum position size
             min_position_size = 5.0  # $5 minimum
@@ -377,7 +552,7 @@ class WhaleFollowingStrategy(TradingStrategy):
                 return None
 
             # Estimate expected profit
-            expected_profit_usd = position_size * (opportunity['expected_profit_pct'] / 100)
+            expected_profit_usd = position_size * (opportunity.expected_profit_pct / 100)
 
             # Validate trade with risk manager
             is_valid, errors = self.risk_manager.validate_trade(
@@ -401,28 +576,21 @@ class WhaleFollowingStrategy(TradingStrategy):
             # Paper trading mode - simulate trade
             if config.PAPER_TRADING_MODE:
                 self.logger.info(
-                    f"PAPER TRADE: Would copy whale {opportunity['whale_nickname']}: "
-                    f"buy {position_size:.2f} USDC of {opportunity['side']} @ {opportunity['current_price']:.3f}"
+                    f"PAPER TRADE: Would copy whale {opportunity.whale_nickname}: "
+                    f"buy {position_size:.2f} USDC of {opportunity.side} @ {opportunity.current_price:.3f}"
                 )
 
-                # Get market question
-                try:
-                    market = self.polymarket.get_market(market_id)
-                    market_question = getattr(market, 'question', 'Unknown')
-                except Exception:
-                    market_question = 'Unknown'
-
                 # Record in database as paper trade
                 trade = db.add_trade(
                     market_id=market_id,
-                    market_question=market_question,
+                    market_question=opportunity.market_question,
                     strategy=self.name,
-                    side=opportunity['side'],
-                    entry_price=opportunity['current_price'],
+                    side=opportunity.side,
+                    entry_price=opportunity.current_price,
                     size_usd=position_size,
                     paper_trade=True,
-                    confidence_score=opportunity['confidence'],
-                    notes=f"{opportunity['reasoning']} | Signal #{signal_id} | Whale position: ${opportunity['whale_position_size_usd']:.2f}"
+                    confidence_score=opportunity.confidence,
+                    notes=f"{opportunity.reasoning} | Signal #{signal_id} | Whale position: ${opportunity.whale_position_size_usd:.2f}"
                 )
 
                 # Mark signal as executed
@@ -434,8 +602,8 @@ class WhaleFollowingStrategy(TradingStrategy):
                 db.add_alert(
                     alert_type="whale_copy",
                     severity="info",
-                    title=f"Copied {opportunity['whale_type']} whale",
-                    message=f"Copied {opportunity['whale_nickname']} ({opportunity['whale_type']}): {opportunity['side']} @ ${opportunity['current_price']:.3f}, size ${position_size:.2f}",
+                    title=f"Copied {opportunity.whale_type} whale",
+                    message=f"Copied {opportunity.whale_nickname} ({opportunity.whale_type}): {opportunity.side} @ ${opportunity.current_price:.3f}, size ${position_size:.2f}",
                     market_id=market_id,
                     strategy=self.name,
                     trade_id=trade.id
@@ -446,8 +614,8 @@ class WhaleFollowingStrategy(TradingStrategy):
             # Live trading mode - execute real trade
             else:
                 self.logger.info(
-                    f"LIVE TRADE: Copying whale {opportunity['whale_nickname']}: "
-                    f"buying {position_size:.2f} USDC of {opportunity['side']} @ {opportunity['current_price']:.3f}"
+                    f"LIVE TRADE: Copying whale {opportunity.whale_nickname}: "
+                    f"buying {position_size:.2f} USDC of {opportunity.side} @ {opportunity.current_price:.3f}"
                 )
 
                 # TODO: Execute actual trade via Polymarket client
@@ -508,7 +676,7 @@ if __name__ == "__main__":
 
     print(f"\nFound {len(opportunities)} opportunities:")
     for i, opp in enumerate(opportunities, 1):
-        print(f"{i}. {opp['reasoning']}")
+        print(f"{i}. {opp.reasoning}")
 
     # Test execution (paper trading)
     if opportunities:
@@ -5,9 +5,11 @@ Manages multiple trading strategies, coordinates execution,
 handles conflicts, and allocates capital.
 """
 
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, List, Optional, Any, Tuple, Type
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+import time
 from abc import ABC, abstractmethod
 
 from agents.utils.config import config
@@ -24,6 +26,12 @@ except (ImportError, ModuleNotFoundError):
 
 logger = logging.getLogger(__name__)
 
+# A risk summary is reused for this long within one orchestration tick
+RISK_SUMMARY_TTL_SECONDS = 2.0
+
+# Performance metrics are reused for this long across get_status() polls
+PERFORMANCE_TTL_SECONDS = 1.0
+
 
 class TradingStrategy(ABC):
     """
@@ -59,7 +67,8 @@ class TradingStrategy(ABC):
         Scan markets and identify trading opportunities.
 
         Returns:
-            List of opportunity dictionaries with keys:
+            List of opportunities, as dictionaries or records (e.g. NamedTuples)
+            passed back to execute_opportunity(), with fields:
             - market_id: str
             - market_question: str
             - side: str (YES/NO)
@@ -76,54 +85,77 @@ class TradingStrategy(ABC):
         Execute a trading opportunity.
 
         Args:
-            opportunity: Opportunity dictionary from find_opportunities()
+            opportunity: Opportunity from find_opportunities()
 
         Returns:
             Trade object if executed, None if not
         """
         pass
 
-    def run(self) -> List[Trade]:
+    def run(self, alerts: Optional[List[Dict]] = None) -> List[Trade]:
         """
         Main execution loop for the strategy.
 
+        Args:
+            alerts: Optional list to queue error alerts on (as db.add_alert()
+                keyword dictionaries) instead of writing each one immediately
+
         Returns:
             List of executed trades
         """
         if not self.enabled:
-            self.logger.info(f"Strategy {self.name} is disabled")
+            self.logger.info("Strategy %s is disabled", self.name)
             return []
 
-        self.logger.info(f"Running strategy: {self.name}")
+        self.logger.info("Running strategy: %s", self.name)
 
         try:
-            # Find opportunities
             opportunities = self.find_opportunities()
-            self.logger.info(f"Found {len(opportunities)} opportunities")
+        except Exception as e:
+            self._report_error(e, alerts)
+            return []
+
+        self.logger.info("Found %d opportunities", len(opportunities))
 
-            # Execute opportunities
-            executed_trades = []
+        # Execute opportunities; scans of other strategies may run
+        # concurrently, but trade validation and recording may not.
+        # A failing opportunity is reported and skipped so the rest of the
+        # batch still gets executed.
+        executed_trades = []
+        with self.risk_manager.trade_lock:
             for opp in opportunities:
-                trade = self.execute_opportunity(opp)
+                try:
+                    trade = self.execute_opportunity(opp)
+                except Exception as e:
+                    self._report_error(e, alerts)
+                    continue
                 if trade:
                     executed_trades.append(trade)
 
-            self.logger.info(f"Executed {len(executed_trades)} trades")
-            return executed_trades
+        self.logger.info("Executed %d trades", len(executed_trades))
+        return executed_trades
 
-        except Exception as e:
-            self.logger.error(f"Error running strategy {self.name}: {e}", exc_info=True)
-
-            # Create alert
-            db.add_alert(
-                alert_type="error",
-                severity="error",
-                title=f"Strategy Error: {self.name}",
-                message=str(e),
-                strategy=self.name
-            )
+    def _report_error(self, error: Exception, alerts: Optional[List[Dict]]) -> None:
+        """
+        Log a strategy error and raise an alert for it.
 
-            return []
+        Args:
+            error: Exception raised while running the strategy
+            alerts: Optional list to queue the alert on instead of writing it
+        """
+        self.logger.error("Error running strategy %s: %s", self.name, error, exc_info=True)
+
+        alert = dict(
+            alert_type="error",
+            severity="error",
+            title=f"Strategy Error: {self.name}",
+            message=str(error),
+            strategy=self.name
+        )
+        if alerts is not None:
+            alerts.append(alert)
+        else:
+            db.add_alert(**alert)
 
     def get_performance_summary(self) -> Dict:
         """
@@ -133,12 +165,10 @@ class TradingStrategy(ABC):
             Performance metrics dictionary
         """
         analyzer = PerformanceAnalyzer()
-        session = db.get_session()
-        try:
-            trades = session.query(Trade).filter(Trade.strategy == self.name).all()
-            return analyzer.calculate_metrics(trades)
-        finally:
-            session.close()
+
+        # Only the profit and gas columns are loaded; no Trade objects are built
+        returns, gas = analyzer.get_trade_returns(strategy=self.name)
+        return analyzer.calculate_metrics_from_arrays(returns, gas)
 
 
 class StrategyManager:
@@ -161,6 +191,52 @@ class StrategyManager:
         self.strategies: Dict[str, TradingStrategy] = {}
         self.logger = logging.getLogger(__name__)
 
+        # (fetched_at monotonic seconds, summary); cleared when trades execute
+        self._risk_summary_cache: Optional[Tuple[float, Dict]] = None
+
+        # (fetched_at monotonic seconds, metrics by strategy)
+        self._performance_cache: Optional[Tuple[float, Dict[str, Dict]]] = None
+
+    def _cached_risk_summary(self) -> Dict:
+        """
+        Get the risk summary, reusing one fetched within RISK_SUMMARY_TTL_SECONDS.
+
+        Returns:
+            Copy of the risk summary dictionary from RiskManager.get_risk_summary(),
+            so callers can't modify the cached value
+        """
+        now = time.monotonic()
+        cached = self._risk_summary_cache
+        if cached is None or now - cached[0] >= RISK_SUMMARY_TTL_SECONDS:
+            cached = (now, self.risk_manager.get_risk_summary())
+            self._risk_summary_cache = cached
+
+        # The status entries are flat dicts, so copying one level deep is enough
+        return {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in cached[1].items()
+        }
+
+    def _cached_performance_metrics(self) -> Dict[str, Dict]:
+        """
+        Get per-strategy performance, reusing one computed within
+        PERFORMANCE_TTL_SECONDS.
+
+        Only closed and settled trades are aggregated, so trades opened in
+        the meantime do not make a cached result stale.
+
+        Returns:
+            Dictionary mapping strategy name to metrics (a copy, so callers
+            can't modify the cached value)
+        """
+        now = time.monotonic()
+        cached = self._performance_cache
+        if cached is None or now - cached[0] >= PERFORMANCE_TTL_SECONDS:
+            cached = (now, self.get_all_performance_metrics())
+            self._performance_cache = cached
+
+        return {name: dict(metrics) for name, metrics in cached[1].items()}
+
     def register_strategy(self, strategy: TradingStrategy):
         """
         Register a trading strategy.
@@ -169,7 +245,7 @@ class StrategyManager:
             strategy: TradingStrategy instance
         """
         self.strategies[strategy.name] = strategy
-        self.logger.info(f"Registered strategy: {strategy.name}")
+        self.logger.info("Registered strategy: %s", strategy.name)
 
     def unregister_strategy(self, strategy_name: str):
         """
@@ -180,19 +256,19 @@ class StrategyManager:
         """
         if strategy_name in self.strategies:
             del self.strategies[strategy_name]
-            self.logger.info(f"Unregistered strategy: {strategy_name}")
+            self.logger.info("Unregistered strategy: %s", strategy_name)
 
     def enable_strategy(self, strategy_name: str):
         """Enable a strategy."""
         if strategy_name in self.strategies:
             self.strategies[strategy_name].enabled = True
-            self.logger.info(f"Enabled strategy: {strategy_name}")
+            self.logger.info("Enabled strategy: %s", strategy_name)
 
     def disable_strategy(self, strategy_name: str):
         """Disable a strategy."""
         if strategy_name in self.strategies:
             self.strategies[strategy_name].enabled = False
-            self.logger.info(f"Disabled strategy: {strategy_name}")
+            self.logger.info("Disabled strategy: %s", strategy_name)
 
     def run_all_strategies(self) -> Dict[str, List[Trade]]:
         """
@@ -202,51 +278,73 @@ class StrategyManager:
             Dictionary mapping strategy name to list of executed trades
         """
         self.logger.info("=" * 60)
-        self.logger.info(f"Running all strategies at {datetime.utcnow()}")
+        self.logger.info("Running all strategies at %s", datetime.utcnow())
         self.logger.info("=" * 60)
 
         # Check risk limits before running any strategies
         self.logger.info("\nChecking risk limits...")
-        risk_summary = self.risk_manager.get_risk_summary()
-
-        if not risk_summary["daily_status"]["ok"]:
-            self.logger.warning(f"Daily loss limit breached: {risk_summary['daily_status']['message']}")
-            db.add_alert(
-                alert_type="risk",
-                severity="critical",
-                title="Daily Loss Limit Breached",
-                message=risk_summary["daily_status"]["message"]
-            )
-            return {}
-
-        if not risk_summary["weekly_status"]["ok"]:
-            self.logger.warning(f"Weekly loss limit breached: {risk_summary['weekly_status']['message']}")
-            db.add_alert(
-                alert_type="risk",
-                severity="critical",
-                title="Weekly Loss Limit Breached",
-                message=risk_summary["weekly_status"]["message"]
+        risk_summary = self._cached_risk_summary()
+
+        # Stop at the first breached loss limit (daily before weekly)
+        for period in ("Daily", "Weekly"):
+            status = risk_summary[f"{period.lower()}_status"]
+            if not status["ok"]:
+                self.logger.warning("%s loss limit breached: %s", period, status["message"])
+                db.add_alert(
+                    alert_type="risk",
+                    severity="critical",
+                    title=f"{period} Loss Limit Breached",
+                    message=status["message"]
+                )
+                return {}
+
+        # Run enabled strategies concurrently; they are dominated by
+        # Polymarket HTTP calls. Results keep registration order.
+        results = {strategy_name: [] for strategy_name in self.strategies}
+        enabled = {
+            strategy_name: strategy
+            for strategy_name, strategy in self.strategies.items()
+            if strategy.enabled
+        }
+        if len(enabled) < len(self.strategies):
+            self.logger.debug(
+                "Skipping disabled strategies: %s",
+                ", ".join(name for name in self.strategies if name not in enabled)
             )
-            return {}
 
-        # Run each strategy
-        results = {}
-        for strategy_name, strategy in self.strategies.items():
-            if strategy.enabled:
-                self.logger.info(f"\nExecuting strategy: {strategy_name}")
-                try:
-                    trades = strategy.run()
-                    results[strategy_name] = trades
-                except Exception as e:
-                    self.logger.error(f"Error executing {strategy_name}: {e}", exc_info=True)
-                    results[strategy_name] = []
-            else:
-                self.logger.info(f"Skipping disabled strategy: {strategy_name}")
-                results[strategy_name] = []
+        if enabled:
+            # SQLite runs on a single shared connection (StaticPool), so one
+            # strategy's session cleanup could roll back another's writes
+            max_workers = 1 if db.database_url.startswith("sqlite") else len(enabled)
+
+            # Strategy error alerts are queued and written in one bulk insert
+            alerts: List[Dict] = []
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for strategy_name, strategy in enabled.items():
+                    self.logger.info("\nExecuting strategy: %s", strategy_name)
+                    futures[executor.submit(strategy.run, alerts)] = strategy_name
+
+                for future in as_completed(futures):
+                    strategy_name = futures[future]
+                    try:
+                        results[strategy_name] = future.result()
+                    except Exception as e:
+                        self.logger.error("Error executing %s: %s", strategy_name, e, exc_info=True)
+
+            try:
+                db.add_alerts(alerts)
+            except Exception as e:
+                self.logger.error("Error saving %d strategy alerts: %s", len(alerts), e)
 
         # Summary
         total_trades = sum(len(trades) for trades in results.values())
-        self.logger.info(f"\nTotal trades executed: {total_trades}")
+        self.logger.info("\nTotal trades executed: %d", total_trades)
+
+        # New trades change exposure and P&L
+        if total_trades:
+            self._risk_summary_cache = None
 
         return results
 
@@ -266,10 +364,16 @@ class StrategyManager:
         strategy = self.strategies[strategy_name]
 
         if not strategy.enabled:
-            self.logger.warning(f"Strategy '{strategy_name}' is disabled")
+            self.logger.warning("Strategy '%s' is disabled", strategy_name)
             return []
 
-        return strategy.run()
+        trades = strategy.run()
+
+        # New trades change exposure and P&L
+        if trades:
+            self._risk_summary_cache = None
+
+        return trades
 
     def get_all_performance_metrics(self) -> Dict[str, Dict]:
         """
@@ -281,29 +385,32 @@ class StrategyManager:
         return self.analyzer.get_strategy_performance()
 
     def print_performance_summary(self):
-        """Print performance summary for all strategies."""
-        print("\n" + "=" * 70)
-        print("STRATEGY MANAGER PERFORMANCE SUMMARY")
-        print("=" * 70)
-
-        # Overall performance
-        report = self.analyzer.generate_performance_report()
-        print(report)
-
-        # Risk summary
-        print("\n" + "=" * 70)
-        print("RISK SUMMARY")
-        print("=" * 70)
-        self.risk_manager.print_risk_summary()
-
-    def get_status(self) -> Dict:
+        """Print performance summary for all strategies with a single write."""
+        print("\n".join((
+            "\n" + "=" * 70,
+            "STRATEGY MANAGER PERFORMANCE SUMMARY",
+            "=" * 70,
+            # Overall performance
+            self.analyzer.generate_performance_report(),
+            # Risk summary
+            "\n" + "=" * 70,
+            "RISK SUMMARY",
+            "=" * 70,
+            self.risk_manager.format_risk_summary(),
+        )))
+
+    def get_status(self, include_performance: bool = True) -> Dict:
         """
         Get current status of the strategy manager.
 
+        Args:
+            include_performance: Whether to run the per-strategy performance
+                aggregation; when False the "performance" key is omitted
+
         Returns:
             Status dictionary
         """
-        return {
+        status = {
             "timestamp": datetime.utcnow().isoformat(),
             "paper_trading_mode": config.PAPER_TRADING_MODE,
             "strategies": {
@@ -313,34 +420,43 @@ class StrategyManager:
                 }
                 for name, strategy in self.strategies.items()
             },
-            "risk_summary": self.risk_manager.get_risk_summary(),
-            "performance": self.get_all_performance_metrics(),
+            "risk_summary": self._cached_risk_summary(),
         }
 
-    def print_status(self):
-        """Print current status."""
-        status = self.get_status()
+        if include_performance:
+            status["performance"] = self._cached_performance_metrics()
 
-        print("\n" + "=" * 70)
-        print("STRATEGY MANAGER STATUS")
-        print("=" * 70)
-        print(f"Timestamp: {status['timestamp']}")
-        print(f"Mode: {'PAPER TRADING' if status['paper_trading_mode'] else 'LIVE TRADING'}")
+        return status
 
-        print(f"\nRegistered Strategies:")
+    def print_status(self):
+        """Print current status with a single write."""
+        # Performance is not printed here, so skip its SQL aggregation
+        status = self.get_status(include_performance=False)
+
+        lines = [
+            "\n" + "=" * 70,
+            "STRATEGY MANAGER STATUS",
+            "=" * 70,
+            f"Timestamp: {status['timestamp']}",
+            f"Mode: {'PAPER TRADING' if status['paper_trading_mode'] else 'LIVE TRADING'}",
+            "\nRegistered Strategies:",
+        ]
         for name, info in status["strategies"].items():
             status_str = "ENABLED" if info["enabled"] else "DISABLED"
-            print(f"  - {name} ({info['class']}): {status_str}")
+            lines.append(f"  - {name} ({info['class']}): {status_str}")
 
-        print(f"\nRisk Summary:")
         risk = status["risk_summary"]
-        print(f"  Available Capital: ${risk['available_capital']:.2f}")
-        print(f"  Total Exposure: ${risk['total_exposure']:.2f} ({risk['exposure_pct']:.1f}%)")
-        print(f"  Open Positions: {risk['open_positions']}")
-        print(f"  Daily Status: {'✓' if risk['daily_status']['ok'] else '✗'} {risk['daily_status']['message']}")
-        print(f"  Weekly Status: {'✓' if risk['weekly_status']['ok'] else '✗'} {risk['weekly_status']['message']}")
-
-        print("=" * 70 + "\n")
+        lines.extend((
+            "\nRisk Summary:",
+            f"  Available Capital: ${risk['available_capital']:.2f}",
+            f"  Total Exposure: ${risk['total_exposure']:.2f} ({risk['exposure_pct']:.1f}%)",
+            f"  Open Positions: {risk['open_positions']}",
+            f"  Daily Status: {'✓' if risk['daily_status']['ok'] else '✗'} {risk['daily_status']['message']}",
+            f"  Weekly Status: {'✓' if risk['weekly_status']['ok'] else '✗'} {risk['weekly_status']['message']}",
+            "=" * 70 + "\n",
+        ))
+
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -12,17 +12,27 @@ Architecture:
 5. Auto-generate signals for high-quality whales
 """
 
+import asyncio
+import json
 import logging
 import time
 import requests
 import os
+import threading
 import hmac
 import hashlib
 import base64
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import orjson
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from agents.utils.database import db, Whale, WhaleTransaction
 from agents.utils.config import config
@@ -35,6 +45,35 @@ API_RATE_LIMIT_DELAY = 1.5  # 1.5 seconds between requests
 API_RETRY_ATTEMPTS = 3
 API_RETRY_BACKOFF = 2.0  # Exponential backoff multiplier
 
+# Pooled HTTP session configuration (keep-alive connections to the CLOB API)
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+# Transport-level retries for connection errors and 5xx responses; 429s are
+# left to the rate-limit backoff in get_market_trades
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF = 0.2
+HTTP_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# CLOB market WebSocket stream configuration
+CLOB_WS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+WS_PING_INTERVAL_SECONDS = 10  # Application-level PING; the server can go silent without it
+WS_MAX_TOKENS_PER_CONNECTION = 250
+WS_RECONNECT_BASE_DELAY = 1.0
+WS_RECONNECT_MAX_DELAY = 60.0
+
+# Processed trade IDs remembered so repeated fetches don't recount trades
+SEEN_TRADES_MAX_SIZE = 100_000
+
+# Concurrent trade fetches per market scan. Requests still start at most
+# once per API_RATE_LIMIT_DELAY overall; the workers overlap response latency
+SCAN_MAX_WORKERS = 16
+
+# How long the active market list is reused across scans
+MARKETS_CACHE_TTL_SECONDS = 300
+
+# Initial trader slots in the columnar trader stats (doubled when full)
+TRADER_STATS_INITIAL_CAPACITY = 4096
+
 
 class PolymarketWhaleDiscovery:
     """
@@ -69,6 +108,18 @@ class PolymarketWhaleDiscovery:
 
         # Polymarket CLOB API
         self.clob_api_base = "https://clob.polymarket.com"
+        self.session = self._create_http_session()
+        self._scan_executor = ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS)
+
+        # Next monotonic time a trades request may start; workers reserve
+        # slots under the lock so the whole instance stays at one request
+        # per API_RATE_LIMIT_DELAY
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+        # Market list client and cache: (fetched_at monotonic, limit, markets)
+        self._polymarket = None
+        self._markets_cache: Optional[Tuple[float, int, List[Dict]]] = None
 
         # Load API credentials from environment
         self.api_key = os.environ.get('POLYMARKET_API_KEY')
@@ -88,14 +139,21 @@ class PolymarketWhaleDiscovery:
         # Track addresses we've seen
         self.tracked_addresses: Set[str] = set()
 
-        # Track trader stats (in-memory cache)
-        self.trader_stats: Dict[str, Dict] = defaultdict(lambda: {
-            'total_volume': 0.0,
-            'trade_count': 0,
-            'first_seen': datetime.utcnow(),
-            'last_seen': datetime.utcnow(),
-            'markets_traded': set()
-        })
+        # Track trader stats (in-memory cache), stored column-wise: each
+        # address maps to a slot in parallel arrays
+        self._trader_index: Dict[str, int] = {}
+        self._trader_addresses: List[str] = []
+        self._trader_volumes = np.zeros(TRADER_STATS_INITIAL_CAPACITY, dtype=np.float64)
+        self._trader_counts = np.zeros(TRADER_STATS_INITIAL_CAPACITY, dtype=np.int64)
+        self._trader_first_seen = np.zeros(TRADER_STATS_INITIAL_CAPACITY, dtype=np.float64)
+        self._trader_last_seen = np.zeros(TRADER_STATS_INITIAL_CAPACITY, dtype=np.float64)
+        # Markets traded, as a 64-bit mask of hashed market IDs: enough to
+        # estimate how diversified a trader is without storing every ID
+        self._trader_market_masks = np.zeros(TRADER_STATS_INITIAL_CAPACITY, dtype=np.uint64)
+
+        # Trades already processed; get_market_trades returns the latest N
+        # trades every call, so without this repeated scans recount volume
+        self._seen_trades = LRUCache(maxsize=SEEN_TRADES_MAX_SIZE)
 
         logger.info(
             f"Whale Discovery initialized: "
@@ -104,6 +162,38 @@ class PolymarketWhaleDiscovery:
             f"auth={'✓ Enabled' if self.has_api_creds else '✗ Disabled'}"
         )
 
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """
+        Create a pooled HTTP session so CLOB API calls reuse connections.
+
+        Returns:
+            requests.Session with a keep-alive connection pool and retries
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=HTTP_RETRY_TOTAL,
+                backoff_factor=HTTP_RETRY_BACKOFF,
+                status_forcelist=HTTP_RETRY_STATUS_CODES,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _wait_for_rate_limit(self):
+        """Block until this instance may send its next trades request."""
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + API_RATE_LIMIT_DELAY
+
+        if start > now:
+            time.sleep(start - now)
+
     def _create_auth_headers(self, method: str, path: str, body: str = "") -> Dict[str, str]:
         """
         Create authentication headers for Polymarket CLOB API.
@@ -175,20 +265,19 @@ class PolymarketWhaleDiscovery:
             try:
                 logger.debug(f"🔍 Fetching trades from {url} with token_id={token_id[:8]}... (attempt {attempt + 1}/{API_RETRY_ATTEMPTS})")
 
-                # Rate limiting - add delay between requests
+                # Exponential backoff for retries
                 if attempt > 0:
-                    # Exponential backoff for retries
                     delay = API_RATE_LIMIT_DELAY * (API_RETRY_BACKOFF ** attempt)
                     logger.debug(f"  Waiting {delay:.2f}s before retry...")
                     time.sleep(delay)
-                else:
-                    # Normal rate limiting
-                    time.sleep(API_RATE_LIMIT_DELAY)
 
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                # Rate limiting - shared across scan worker threads
+                self._wait_for_rate_limit()
+
+                response = self.session.get(url, params=params, headers=headers, timeout=10)
 
                 if response.status_code == 200:
-                    trades = response.json()
+                    trades = orjson.loads(response.content)
                     logger.info(f"✓ Fetched {len(trades)} trades for token {token_id[:8]}...")
                     if len(trades) > 0:
                         # Log first trade as example
@@ -235,10 +324,10 @@ class PolymarketWhaleDiscovery:
             url = f"{self.clob_api_base}/book"
             params = {'token_id': token_id}
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.warning(f"Failed to fetch orderbook: HTTP {response.status_code}")
                 return {}
@@ -247,13 +336,84 @@ class PolymarketWhaleDiscovery:
             logger.error(f"Error fetching orderbook: {e}")
             return {}
 
-    def process_trade(self, trade: Dict, market_id: str) -> Optional[str]:
+    def _trader_slot(self, address: str, now: Optional[float] = None) -> int:
+        """
+        Get the stats slot for a trader, allocating (and growing) as needed.
+
+        Args:
+            address: Trader address
+            now: Epoch seconds to record as first seen (defaults to the current time)
+
+        Returns:
+            Index into the trader stats arrays
+        """
+        i = self._trader_index.get(address)
+        if i is not None:
+            return i
+
+        i = len(self._trader_addresses)
+        if i == len(self._trader_volumes):
+            capacity = 2 * i
+            self._trader_volumes = np.resize(self._trader_volumes, capacity)
+            self._trader_counts = np.resize(self._trader_counts, capacity)
+            self._trader_first_seen = np.resize(self._trader_first_seen, capacity)
+            self._trader_last_seen = np.resize(self._trader_last_seen, capacity)
+            self._trader_market_masks = np.resize(self._trader_market_masks, capacity)
+
+        if now is None:
+            now = time.time()
+        self._trader_index[address] = i
+        self._trader_addresses.append(address)
+        self._trader_volumes[i] = 0.0
+        self._trader_counts[i] = 0
+        self._trader_first_seen[i] = now
+        self._trader_last_seen[i] = now
+        self._trader_market_masks[i] = 0
+        return i
+
+    def get_trader_stats(self, address: str) -> Dict:
+        """
+        Get the tracked stats for a trader.
+
+        Args:
+            address: Trader address
+
+        Returns:
+            Dict with total_volume, trade_count, first_seen, last_seen and
+            markets_traded, an approximate distinct market count (at most 64)
+            (zeroed, with no timestamps, if the trader hasn't been seen)
+        """
+        i = self._trader_index.get(address)
+        if i is None:
+            return {
+                'total_volume': 0.0,
+                'trade_count': 0,
+                'first_seen': None,
+                'last_seen': None,
+                'markets_traded': 0
+            }
+
+        return {
+            'total_volume': float(self._trader_volumes[i]),
+            'trade_count': int(self._trader_counts[i]),
+            'first_seen': datetime.utcfromtimestamp(self._trader_first_seen[i]),
+            'last_seen': datetime.utcfromtimestamp(self._trader_last_seen[i]),
+            'markets_traded': bin(int(self._trader_market_masks[i])).count("1")
+        }
+
+    def process_trade(
+        self,
+        trade: Dict,
+        market_id: str,
+        now: Optional[float] = None
+    ) -> Optional[str]:
         """
         Process a single trade and update trader stats.
 
         Args:
             trade: Trade data from CLOB API
             market_id: Market ID this trade belongs to
+            now: Epoch seconds to record as last seen (defaults to the current time)
 
         Returns:
             Trader address if trade is whale-sized, None otherwise
@@ -288,21 +448,24 @@ class PolymarketWhaleDiscovery:
                     logger.debug(f"  ✗ Skipping invalid address: {address}")
                     continue
 
-                stats = self.trader_stats[address]
-                stats['total_volume'] += trade_value_usd
-                stats['trade_count'] += 1
-                stats['last_seen'] = datetime.utcnow()
-                stats['markets_traded'].add(market_id)
+                if now is None:
+                    now = time.time()
+                i = self._trader_slot(address, now)
+                self._trader_volumes[i] += trade_value_usd
+                self._trader_counts[i] += 1
+                self._trader_last_seen[i] = now
+                self._trader_market_masks[i] |= np.uint64(1 << (hash(market_id) & 63))
+                total_volume = self._trader_volumes[i]
 
                 logger.info(
                     f"  📈 Trader {address[:8]}...: "
                     f"${trade_value_usd:,.0f} trade, "
-                    f"total: ${stats['total_volume']:,.0f} ({stats['trade_count']} trades)"
+                    f"total: ${total_volume:,.0f} ({self._trader_counts[i]} trades)"
                 )
 
                 # Check if this trader qualifies as a whale
-                if stats['total_volume'] >= self.min_total_volume_usd:
-                    logger.info(f"  🐋 WHALE THRESHOLD REACHED: {address[:8]}... (${stats['total_volume']:,.0f})")
+                if total_volume >= self.min_total_volume_usd:
+                    logger.info(f"  🐋 WHALE THRESHOLD REACHED: {address[:8]}... (${total_volume:,.0f})")
                     return address
 
             return None
@@ -322,7 +485,7 @@ class PolymarketWhaleDiscovery:
         Returns:
             Whale object if created/updated
         """
-        stats = self.trader_stats[address]
+        stats = self.get_trader_stats(address)
 
         # Check if whale already exists
         whale = self.whale_monitor.get_whale(address)
@@ -359,6 +522,35 @@ class PolymarketWhaleDiscovery:
 
             return whale
 
+    def create_or_update_whales(self, addresses: Iterable[str]) -> Set[str]:
+        """
+        Create or update whale records for many traders in one upsert.
+
+        Args:
+            addresses: Trader addresses
+
+        Returns:
+            Addresses of newly discovered whales
+        """
+        stats = {}
+        for address in addresses:
+            trader = self.get_trader_stats(address)
+            stats[address] = (Decimal(str(trader['total_volume'])), trader['trade_count'])
+
+        new_whales = self.whale_monitor.upsert_whale_stats(stats)
+
+        for address in new_whales:
+            trader = stats[address]
+            logger.info(
+                f"🐋 NEW WHALE DISCOVERED: {address[:8]}... "
+                f"(volume: ${trader[0]:,.0f}, "
+                f"trades: {trader[1]})"
+            )
+
+        self.tracked_addresses.update(new_whales)
+
+        return new_whales
+
     def score_whale_if_ready(self, address: str) -> Optional[float]:
         """
         Score whale if they have enough trade history.
@@ -369,7 +561,7 @@ class PolymarketWhaleDiscovery:
         Returns:
             Quality score if calculated, None otherwise
         """
-        stats = self.trader_stats[address]
+        stats = self.get_trader_stats(address)
 
         # Need minimum trades for reliable scoring
         if stats['trade_count'] < self.min_trades_for_scoring:
@@ -383,36 +575,121 @@ class PolymarketWhaleDiscovery:
         quality_score = self.whale_scorer.update_whale_score(address)
 
         if quality_score:
-            whale = self.whale_monitor.get_whale(address)
+            addr_lower = address.lower()
 
-            logger.info(
-                f"📊 WHALE SCORED: {whale.nickname or address[:8]}... "
-                f"quality={quality_score:.2f} ({whale.whale_type})"
-            )
+            # One session for the log lookup and the auto-track update
+            with db.session_scope() as session:
+                nickname, whale_type = session.query(
+                    Whale.nickname, Whale.whale_type
+                ).filter(Whale.address == addr_lower).one()
 
-            # Auto-track if quality is high enough
-            if quality_score >= config.WHALE_MIN_QUALITY_SCORE:
-                session = db.get_session()
-                try:
-                    whale = session.query(Whale).filter(
-                        Whale.address == address.lower()
-                    ).first()
+                logger.info(
+                    f"📊 WHALE SCORED: {nickname or address[:8]}... "
+                    f"quality={quality_score:.2f} ({whale_type})"
+                )
 
-                    if whale and not whale.is_tracked:
-                        whale.is_tracked = True
-                        session.commit()
+                # Auto-track if quality is high enough (no-op if already tracked)
+                if quality_score >= config.WHALE_MIN_QUALITY_SCORE:
+                    newly_tracked = session.query(Whale).filter(
+                        Whale.address == addr_lower,
+                        Whale.is_tracked.is_not(True)
+                    ).update({Whale.is_tracked: True}, synchronize_session=False)
 
+                    if newly_tracked:
                         logger.info(
-                            f"✅ AUTO-TRACKING WHALE: {whale.nickname or address[:8]}... "
+                            f"✅ AUTO-TRACKING WHALE: {nickname or address[:8]}... "
                             f"(quality {quality_score:.2f})"
                         )
-                finally:
-                    session.close()
 
             return quality_score
 
         return None
 
+    def _unseen_trades(self, trades: List[Dict]) -> List[Dict]:
+        """
+        Drop trades that were already processed, remembering the rest.
+
+        Trades are keyed on their CLOB trade ID (falling back to the
+        transaction hash); trades with neither are always kept.
+
+        Args:
+            trades: Trade data from CLOB API
+
+        Returns:
+            Trades not seen before, in their original order
+        """
+        seen = self._seen_trades
+        unseen = []
+        for trade in trades:
+            key = trade.get('id') or trade.get('transaction_hash')
+            if key is not None:
+                if key in seen:
+                    continue
+                seen[key] = True
+            unseen.append(trade)
+        return unseen
+
+    def _large_trades(self, trades: List[Dict]) -> List[Dict]:
+        """
+        Pre-filter a batch of trades down to those worth at least min_trade_size_usd.
+
+        Trade values are computed for the whole batch at once, so only the
+        (few) large trades go through the per-trade process_trade path.
+
+        Args:
+            trades: Trade data from CLOB API
+
+        Returns:
+            Large trades, in their original order
+        """
+        try:
+            sizes = np.fromiter(
+                (float(t.get('size', 0)) for t in trades), dtype=np.float64, count=len(trades)
+            )
+            prices = np.fromiter(
+                (float(t.get('price', 0)) for t in trades), dtype=np.float64, count=len(trades)
+            )
+        except (AttributeError, TypeError, ValueError):
+            # Malformed trade in the batch: let process_trade log and skip it
+            return trades
+
+        values = sizes * prices
+        return [trades[i] for i in np.flatnonzero(values >= self.min_trade_size_usd)]
+
+    def process_trades(self, trades: List[Dict], market_id: str) -> int:
+        """
+        Process a batch of trades, creating and scoring whales as they qualify.
+
+        Args:
+            trades: Trade data from CLOB API
+            market_id: Market ID these trades belong to
+
+        Returns:
+            Number of whale-sized trades found
+        """
+        # Whale address -> number of whale-sized trades, in first-seen order
+        dirty: Dict[str, int] = {}
+        now = time.time()
+
+        for trade in self._large_trades(self._unseen_trades(trades)):
+            # Process trade and check if whale-sized
+            whale_address = self.process_trade(trade, market_id, now)
+
+            if whale_address:
+                dirty[whale_address] = dirty.get(whale_address, 0) + 1
+
+        if not dirty:
+            return 0
+
+        # Create or update all whales from this batch at once
+        self.create_or_update_whales(dirty)
+
+        # Try to score if ready
+        for whale_address in dirty:
+            self.score_whale_if_ready(whale_address)
+
+        return sum(dirty.values())
+
     def scan_market_for_whales(self, market_id: str, token_ids: List[str]) -> int:
         """
         Scan a single market for whale activity.
@@ -432,19 +709,7 @@ class PolymarketWhaleDiscovery:
             # Get recent trades
             trades = self.get_market_trades(token_id, limit=50)
             total_trades += len(trades)
-
-            for trade in trades:
-                # Process trade and check if whale-sized
-                whale_address = self.process_trade(trade, market_id)
-
-                if whale_address:
-                    # Create or update whale
-                    whale = self.create_or_update_whale(whale_address)
-
-                    if whale:
-                        # Try to score if ready
-                        self.score_whale_if_ready(whale_address)
-                        whales_found += 1
+            whales_found += self.process_trades(trades, market_id)
 
         if total_trades > 0:
             logger.info(f"  Market {market_id[:10]}...: processed {total_trades} trades, found {whales_found} whale(s)")
@@ -453,6 +718,38 @@ class PolymarketWhaleDiscovery:
 
         return whales_found
 
+    def get_active_markets(self, limit: int = 100) -> List[Dict]:
+        """
+        Get active markets, reusing the last fetch for MARKETS_CACHE_TTL_SECONDS.
+
+        Args:
+            limit: Max markets to fetch
+
+        Returns:
+            List of market dicts
+        """
+        cached = self._markets_cache
+        if (
+            cached is not None
+            and cached[1] == limit
+            and time.monotonic() - cached[0] < MARKETS_CACHE_TTL_SECONDS
+        ):
+            return cached[2]
+
+        if self._polymarket is None:
+            from agents.polymarket.polymarket_paper import PolymarketPaper
+            self._polymarket = PolymarketPaper()
+
+        # Use limited fetch to avoid API rate limiting
+        # The API returns markets sorted by activity, so first N are most active
+        markets = self._polymarket.get_tradeable_markets(limit=limit)
+        self._markets_cache = (time.monotonic(), limit, markets)
+        return markets
+
+    def invalidate_markets_cache(self):
+        """Force the next scan to re-fetch the active market list."""
+        self._markets_cache = None
+
     def scan_all_markets(
         self,
         limit: int = 100,
@@ -474,12 +771,7 @@ class PolymarketWhaleDiscovery:
 
         try:
             # Get active markets from Polymarket
-            from agents.polymarket.polymarket_paper import PolymarketPaper
-            polymarket = PolymarketPaper()
-
-            # Use limited fetch to avoid API rate limiting
-            # The API returns markets sorted by activity, so first N are most active
-            markets = polymarket.get_tradeable_markets(limit=limit)
+            markets = self.get_active_markets(limit)
             logger.info(f"Found {len(markets)} active markets")
 
             # Log sample of markets for debugging
@@ -498,47 +790,55 @@ class PolymarketWhaleDiscovery:
             total_whales = 0
             markets_scanned = 0
             markets_with_no_tokens = 0
-            total_trades_found = 0
 
+            # Fetch every (market, token) pair's trades concurrently
+            futures = {}
             for market in markets_to_scan:
-                try:
-                    # Get token IDs for this market
-                    # Markets are dicts, not objects, so use dict access not hasattr()
-                    token_ids = market.get('clobTokenIds') or market.get('clob_token_ids', [])
-
-                    if not token_ids:
-                        markets_with_no_tokens += 1
-                        market_id = market.get('id') or market.get('market_id', 'unknown')
-                        logger.debug(f"  ✗ Market {market_id[:10]}... has no token IDs")
-                        continue
-
-                    # Scan market
-                    market_id = market.get('id') or market.get('market_id', '')
-                    market_question = market.get('question', 'Unknown question')
-                    logger.info(f"  → Scanning market {market_id[:10]}...: {market_question[:60]}...")
-
-                    whales = self.scan_market_for_whales(market_id, token_ids)
-                    total_whales += whales
-                    markets_scanned += 1
-
-                    if whales > 0:
-                        logger.info(
-                            f"  ✓ Market {market_id[:10]}...: "
-                            f"found {whales} whale trade(s)"
-                        )
+                # Get token IDs for this market
+                # Markets are dicts, not objects, so use dict access not hasattr()
+                token_ids = self.get_token_ids(market)
 
-                except Exception as e:
+                if not token_ids:
+                    markets_with_no_tokens += 1
                     market_id = market.get('id') or market.get('market_id', 'unknown')
-                    logger.error(f"Error scanning market {market_id}: {e}", exc_info=True)
+                    logger.debug(f"  ✗ Market {market_id[:10]}... has no token IDs")
                     continue
 
+                # Scan market
+                market_id = market.get('id') or market.get('market_id', '')
+                market_question = market.get('question', 'Unknown question')
+                logger.info(f"  → Scanning market {market_id[:10]}...: {market_question[:60]}...")
+                markets_scanned += 1
+
+                for token_id in token_ids:
+                    future = self._scan_executor.submit(self.get_market_trades, token_id, 50)
+                    futures[future] = market_id
+
+            # Process trades on this thread as fetches complete, so
+            # trader stats are only ever written from one thread
+            whales_by_market: Dict[str, int] = defaultdict(int)
+            for future in as_completed(futures):
+                market_id = futures[future]
+                try:
+                    whales_by_market[market_id] += self.process_trades(future.result(), market_id)
+                except Exception as e:
+                    logger.error(f"Error scanning market {market_id}: {e}", exc_info=True)
+
+            for market_id, whales in whales_by_market.items():
+                total_whales += whales
+                if whales > 0:
+                    logger.info(
+                        f"  ✓ Market {market_id[:10]}...: "
+                        f"found {whales} whale trade(s)"
+                    )
+
             # Summary
             stats = {
                 'markets_scanned': markets_scanned,
                 'markets_with_no_tokens': markets_with_no_tokens,
                 'whale_trades_found': total_whales,
                 'unique_whales_tracked': len(self.tracked_addresses),
-                'total_traders_seen': len(self.trader_stats)
+                'total_traders_seen': len(self._trader_addresses)
             }
 
             logger.info("=" * 70)
@@ -552,17 +852,15 @@ class PolymarketWhaleDiscovery:
             logger.info(f"Total traders seen: {stats['total_traders_seen']}")
 
             # Log trader stats summary
-            if len(self.trader_stats) > 0:
+            trader_count = len(self._trader_addresses)
+            if trader_count > 0:
                 logger.info("\n📊 Trader stats summary:")
-                sorted_traders = sorted(
-                    self.trader_stats.items(),
-                    key=lambda x: x[1]['total_volume'],
-                    reverse=True
-                )[:5]  # Top 5
-                for address, stats in sorted_traders:
+                volumes = self._trader_volumes[:trader_count]
+                top_traders = np.argsort(-volumes, kind='stable')[:5]  # Top 5
+                for i in top_traders:
                     logger.info(
-                        f"  {address[:8]}...: ${stats['total_volume']:,.2f} "
-                        f"({stats['trade_count']} trades)"
+                        f"  {self._trader_addresses[i][:8]}...: ${volumes[i]:,.2f} "
+                        f"({self._trader_counts[i]} trades)"
                     )
 
             return stats
@@ -571,6 +869,158 @@ class PolymarketWhaleDiscovery:
             logger.error(f"Error in market scan: {e}", exc_info=True)
             return {}
 
+    @staticmethod
+    def get_token_ids(market: Dict) -> List[str]:
+        """
+        Get the CLOB token IDs (YES/NO) for a market dict.
+
+        Args:
+            market: Market data from the Gamma API
+
+        Returns:
+            List of token IDs (empty if the market has none)
+        """
+        return market.get('clobTokenIds') or market.get('clob_token_ids', [])
+
+    def _process_streamed_trade(self, token_id: str, market_id: str) -> int:
+        """
+        Fetch and process the trades behind a streamed whale-sized fill.
+
+        Stream events carry price and size but not the trader addresses, so
+        the token's recent trades are pulled over REST.
+
+        Args:
+            token_id: Token ID the event was for
+            market_id: Market ID the token belongs to
+
+        Returns:
+            Number of whale-sized trades found
+        """
+        return self.process_trades(self.get_market_trades(token_id, limit=50), market_id)
+
+    async def _stream_token_batch(
+        self,
+        token_markets: Dict[str, str],
+        process_lock: asyncio.Lock
+    ):
+        """
+        Subscribe to the market stream for one batch of tokens, reconnecting forever.
+
+        Args:
+            token_markets: Token ID -> market ID for this connection
+            process_lock: Lock serializing trade processing across connections
+        """
+        import websockets
+
+        subscribe = json.dumps({'assets_ids': list(token_markets), 'type': 'market'})
+        delay = WS_RECONNECT_BASE_DELAY
+
+        async def keepalive(ws):
+            while True:
+                await asyncio.sleep(WS_PING_INTERVAL_SECONDS)
+                await ws.send("PING")
+
+        while True:
+            try:
+                async with websockets.connect(CLOB_WS_MARKET_URL, ping_interval=None) as ws:
+                    await ws.send(subscribe)
+                    logger.info(f"📡 Streaming trades for {len(token_markets)} token(s)")
+                    delay = WS_RECONNECT_BASE_DELAY
+
+                    pinger = asyncio.create_task(keepalive(ws))
+                    try:
+                        async for raw in ws:
+                            if raw == "PONG":
+                                continue
+
+                            events = orjson.loads(raw)
+                            if isinstance(events, dict):
+                                events = [events]
+
+                            for event in events:
+                                if event.get('event_type') != 'last_trade_price':
+                                    continue
+
+                                token_id = event.get('asset_id', '')
+                                market_id = token_markets.get(token_id)
+                                if market_id is None:
+                                    continue
+
+                                trade_value_usd = float(event.get('size', 0)) * float(event.get('price', 0))
+                                if trade_value_usd < self.min_trade_size_usd:
+                                    continue
+
+                                logger.info(
+                                    f"  📡 Streamed ${trade_value_usd:,.0f} fill on token {token_id[:8]}..."
+                                )
+                                async with process_lock:
+                                    await asyncio.to_thread(
+                                        self._process_streamed_trade, token_id, market_id
+                                    )
+                    finally:
+                        pinger.cancel()
+
+                logger.warning("Trade stream closed by server, reconnecting...")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Trade stream error: {e}. Reconnecting in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, WS_RECONNECT_MAX_DELAY)
+
+    async def stream_trades(
+        self,
+        limit: int = 100,
+        backfill: bool = True
+    ):
+        """
+        Discover whales from the CLOB market WebSocket instead of polling.
+
+        Subscribes to last_trade_price events for the tokens of the active
+        markets (in batches of WS_MAX_TOKENS_PER_CONNECTION per connection)
+        and only hits the REST API for tokens that just had a whale-sized fill.
+
+        Args:
+            limit: Max markets to subscribe to
+            backfill: Run one REST scan first to seed trader stats
+        """
+        markets = await asyncio.to_thread(self.get_active_markets, limit)
+
+        token_markets: Dict[str, str] = {}
+        for market in markets:
+            market_id = market.get('id') or market.get('market_id', '')
+            for token_id in self.get_token_ids(market):
+                token_markets[token_id] = market_id
+
+        if not token_markets:
+            logger.warning("No token IDs found to stream")
+            return
+
+        if backfill:
+            # Cold start: seed trader stats from recent REST history
+            def run_backfill():
+                for token_id, market_id in token_markets.items():
+                    self._process_streamed_trade(token_id, market_id)
+
+            await asyncio.to_thread(run_backfill)
+
+        token_ids = list(token_markets)
+        batches = [
+            {token_id: token_markets[token_id] for token_id in token_ids[i:i + WS_MAX_TOKENS_PER_CONNECTION]}
+            for i in range(0, len(token_ids), WS_MAX_TOKENS_PER_CONNECTION)
+        ]
+
+        logger.info(
+            f"Streaming {len(token_ids)} token(s) from {len(markets)} market(s) "
+            f"over {len(batches)} connection(s)"
+        )
+
+        process_lock = asyncio.Lock()
+        await asyncio.gather(
+            *(self._stream_token_batch(batch, process_lock) for batch in batches)
+        )
+
     def run_continuous_discovery(
         self,
         scan_interval_seconds: int = 300,
@@ -602,8 +1052,7 @@ class PolymarketWhaleDiscovery:
                 stats = self.scan_all_markets(limit=markets_per_scan)
 
                 # Log whale summary
-                monitor = WhaleMonitor()
-                whale_stats = monitor.get_summary_stats()
+                whale_stats = self.whale_monitor.get_summary_stats()
 
                 logger.info(f"\n📊 Current whale database:")
                 logger.info(f"  Total whales: {whale_stats['total_whales']}")
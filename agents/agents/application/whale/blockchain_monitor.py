@@ -82,20 +82,31 @@ class BlockchainMonitor:
         """
         Monitor blockchain for new transactions (real-time mode).
 
-        PLACEHOLDER - Needs implementation:
+        PLACEHOLDER - Needs implementation. Prefer a WebSocket log
+        subscription over filter polling, so events arrive as they are
+        mined instead of once per poll_interval:
 
         ```python
-        # Setup event filter for CTF Exchange
-        event_filter = ctf_exchange.events.OrderFilled.createFilter(fromBlock='latest')
-
-        while True:
-            for event in event_filter.get_new_entries():
+        from web3 import AsyncWeb3, WebsocketProviderV2
+
+        w3 = AsyncWeb3.persistent_websocket(WebsocketProviderV2(config.POLYGON_WSS_URL))
+        async with w3 as w3:
+            await w3.eth.subscribe("logs", {
+                "address": config.CTF_EXCHANGE_ADDRESS,
+                "topics": [ORDER_FILLED_TOPIC],
+            })
+            async for message in w3.ws.process_subscriptions():
+                event = ctf_exchange.events.OrderFilled().process_log(message["result"])
                 self.process_transaction(event)
-            time.sleep(poll_interval)
         ```
 
+        Some providers silently drop subscriptions, so also keep a heartbeat
+        (time of the last event/new head) and fall back to polling
+        `eth_getLogs` every poll_interval seconds from the last seen block
+        when it goes stale, re-subscribing in the background.
+
         Args:
-            poll_interval: Seconds between polling
+            poll_interval: Seconds between polls in the fallback path
         """
         logger.warning(
             "Blockchain monitoring not implemented. "
@@ -144,17 +155,18 @@ class BlockchainMonitor:
 
         Used to build initial profile when discovering a new whale.
 
-        PLACEHOLDER - Needs implementation:
+        PLACEHOLDER - Needs implementation. A bounded backfill is a single
+        `eth_getLogs` range query, cheaper than streaming:
 
         ```python
-        # Get past events for this address
-        event_filter = ctf_exchange.events.OrderFilled.createFilter(
+        # Get past events for this address in one range query
+        events = ctf_exchange.events.OrderFilled.get_logs(
             fromBlock=current_block - blocks_back,
             argument_filters={'maker': address}
         )
 
         transactions = []
-        for event in event_filter.get_all_entries():
+        for event in events:
             tx = self.process_transaction(event)
             if tx:
                 transactions.append(tx)
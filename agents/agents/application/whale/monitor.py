@@ -7,10 +7,12 @@ valuable trading signals.
 """
 
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from sqlalchemy.dialects import postgresql, sqlite
+
 from agents.utils.database import db, Whale, WhalePosition, WhaleTransaction
 from agents.utils.config import config
 
@@ -90,6 +92,39 @@ class WhaleMonitor:
         finally:
             session.close()
 
+    def get_whales(self, addresses: Iterable[str]) -> Dict[str, Whale]:
+        """
+        Get whale records for many addresses at once.
+
+        Tracked whales come from the in-memory cache; the rest are loaded
+        with a single database query.
+
+        Args:
+            addresses: Ethereum addresses of whales
+
+        Returns:
+            Dictionary of address (as given) -> Whale, only for addresses found
+        """
+        whales = {}
+        missing: Dict[str, List[str]] = {}
+        for address in set(addresses):
+            addr_lower = address.lower()
+            if addr_lower in self.tracked_whales:
+                whales[address] = self.tracked_whales[addr_lower]
+            else:
+                missing.setdefault(addr_lower, []).append(address)
+
+        if missing:
+            session = db.get_session()
+            try:
+                for whale in session.query(Whale).filter(Whale.address.in_(missing)):
+                    for address in missing.get(whale.address, ()):
+                        whales[address] = whale
+            finally:
+                session.close()
+
+        return whales
+
     def is_tracked_whale(self, address: str) -> bool:
         """
         Check if address is a tracked whale.
@@ -212,6 +247,83 @@ class WhaleMonitor:
         finally:
             session.close()
 
+    def upsert_whale_stats(self, stats: Dict[str, Tuple[Decimal, int]]) -> Set[str]:
+        """
+        Create or update many whales' volume and trade count in one statement.
+
+        New whales are inserted untracked with a neutral classification;
+        existing whales only get their volume, trade count and activity
+        timestamps updated.
+
+        Args:
+            stats: Address -> (total_volume_usd, total_trades)
+
+        Returns:
+            Lowercased addresses that were newly created
+        """
+        if not stats:
+            return set()
+
+        rows: Dict[str, Tuple[Decimal, int]] = {
+            address.lower(): values for address, values in stats.items()
+        }
+
+        dialect = db.engine.dialect.name
+        if dialect == "postgresql":
+            insert = postgresql.insert
+        elif dialect == "sqlite":
+            insert = sqlite.insert
+        else:
+            # No portable upsert: fall back to one write per whale
+            existing = set(self.get_whales(rows))
+            for address, (total_volume_usd, total_trades) in rows.items():
+                if address not in existing:
+                    self.add_whale(address)
+                self.update_whale_stats(
+                    address, total_volume_usd=total_volume_usd, total_trades=total_trades
+                )
+            return set(rows) - existing
+
+        now = datetime.utcnow()
+        stmt = insert(Whale).values([
+            {
+                'address': address,
+                'quality_score': 0.0,
+                'whale_type': 'neutral',
+                'is_tracked': False,
+                'total_volume_usd': total_volume_usd,
+                'total_trades': total_trades,
+                'first_seen_at': now,
+                'last_activity_at': now,
+                'updated_at': now,
+            }
+            for address, (total_volume_usd, total_trades) in rows.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Whale.address],
+            set_={
+                'total_volume_usd': stmt.excluded.total_volume_usd,
+                'total_trades': stmt.excluded.total_trades,
+                'last_activity_at': stmt.excluded.last_activity_at,
+                'updated_at': stmt.excluded.updated_at,
+            }
+        )
+
+        with db.session_scope() as session:
+            existing = {
+                address for (address,) in
+                session.query(Whale.address).filter(Whale.address.in_(rows))
+            }
+            session.execute(stmt)
+
+            # Refresh in-memory cache for tracked whales
+            tracked = [address for address in rows if address in self.tracked_whales]
+            if tracked:
+                for whale in session.query(Whale).filter(Whale.address.in_(tracked)):
+                    self.tracked_whales[whale.address] = whale
+
+        return set(rows) - existing
+
     def get_whale_positions(self, address: str, status: str = "open") -> List[WhalePosition]:
         """
         Get whale's current positions.
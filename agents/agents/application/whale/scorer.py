@@ -7,6 +7,7 @@ whales are worth copying (smart money) vs those to avoid (dumb money).
 """
 
 import logging
+from collections import defaultdict
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -149,11 +150,9 @@ class WhaleScorer:
 
             # Simplified consistency: check if majority of time periods are profitable
             # Split into weekly buckets
-            weekly_profits = {}
+            weekly_profits: Dict[str, float] = defaultdict(float)
             for tx in transactions:
                 week_key = tx.timestamp.strftime("%Y-W%W")
-                if week_key not in weekly_profits:
-                    weekly_profits[week_key] = 0.0
 
                 # Estimate profit (simplified - in production would calculate actual P&L)
                 if tx.transaction_type == "SELL":
@@ -7,15 +7,20 @@ appropriate confidence levels based on whale quality scores.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from sqlalchemy import and_, or_
+
 from agents.utils.database import db, Whale, WhalePosition, WhaleTransaction, WhaleSignal
 from agents.utils.config import config
 
 logger = logging.getLogger(__name__)
 
+# Copyable signals are read this many rows per query
+SIGNAL_PAGE_SIZE = 100
+
 
 class WhaleSignalGenerator:
     """
@@ -246,6 +251,103 @@ class WhaleSignalGenerator:
         finally:
             session.close()
 
+    def iter_copyable_signals_with_whales(
+        self,
+        copy_delay_seconds: Optional[int] = None,
+        min_quality: Optional[float] = None,
+        page_size: int = SIGNAL_PAGE_SIZE
+    ) -> Iterator[List[Tuple[WhaleSignal, Whale]]]:
+        """
+        Yield copyable signals joined with their whale, one page at a time,
+        highest whale quality first and oldest first within a quality.
+
+        Signals whose whale is unknown or below min_quality are not returned.
+        Each page is read in its own short session and paging is keyed on
+        (quality, signal age), so callers may stop early and may update
+        signal status between pages.
+
+        Args:
+            copy_delay_seconds: Delay before copying (defaults to config)
+            min_quality: Minimum whale quality score (defaults to config)
+            page_size: Rows per query
+
+        Yields:
+            Lists of (WhaleSignal, Whale) tuples ready for execution
+        """
+        if copy_delay_seconds is None:
+            copy_delay_seconds = config.WHALE_COPY_DELAY_SECONDS
+        if min_quality is None:
+            min_quality = config.WHALE_MIN_QUALITY_SCORE
+
+        cutoff_time = datetime.utcnow() - timedelta(seconds=copy_delay_seconds)
+        last_key = None
+
+        while True:
+            session = db.get_session()
+            try:
+                query = session.query(WhaleSignal, Whale).join(
+                    Whale, Whale.address == WhaleSignal.whale_address
+                ).filter(
+                    WhaleSignal.status == "pending",
+                    WhaleSignal.created_at <= cutoff_time,
+                    WhaleSignal.confidence >= self.min_whale_quality,
+                    Whale.quality_score >= min_quality
+                )
+
+                if last_key is not None:
+                    last_quality, last_created_at, last_id = last_key
+                    query = query.filter(or_(
+                        Whale.quality_score < last_quality,
+                        and_(Whale.quality_score == last_quality, or_(
+                            WhaleSignal.created_at > last_created_at,
+                            and_(WhaleSignal.created_at == last_created_at, WhaleSignal.id > last_id)
+                        ))
+                    ))
+
+                rows = query.order_by(
+                    Whale.quality_score.desc(), WhaleSignal.created_at, WhaleSignal.id
+                ).limit(page_size).all()
+
+            finally:
+                session.close()
+
+            if not rows:
+                return
+
+            yield rows
+
+            if len(rows) < page_size:
+                return
+
+            last_signal, last_whale = rows[-1]
+            last_key = (last_whale.quality_score, last_signal.created_at, last_signal.id)
+
+    def get_copyable_signals_with_whales(
+        self,
+        copy_delay_seconds: Optional[int] = None,
+        min_quality: Optional[float] = None
+    ) -> List[Tuple[WhaleSignal, Whale]]:
+        """
+        Get copyable signals joined with their whale, filtered by whale quality
+        in the database.
+
+        Args:
+            copy_delay_seconds: Delay before copying (defaults to config)
+            min_quality: Minimum whale quality score (defaults to config)
+
+        Returns:
+            List of (WhaleSignal, Whale) tuples, highest whale quality first
+        """
+        rows = [
+            row
+            for page in self.iter_copyable_signals_with_whales(copy_delay_seconds, min_quality)
+            for row in page
+        ]
+
+        logger.info(f"Found {len(rows)} copyable signals from whales")
+
+        return rows
+
     def mark_signal_executed(
         self,
         signal_id: int,
@@ -303,6 +405,43 @@ class WhaleSignalGenerator:
         finally:
             session.close()
 
+    def mark_signals_ignored(
+        self,
+        ignored: List[Tuple[int, str]]
+    ):
+        """
+        Mark several signals as ignored in one transaction.
+
+        Args:
+            ignored: List of (signal_id, reason) tuples
+        """
+        if not ignored:
+            return
+
+        reasons = dict(ignored)
+
+        session = db.get_session()
+        try:
+            signals = session.query(WhaleSignal).filter(
+                WhaleSignal.id.in_(reasons)
+            ).all()
+
+            for signal in signals:
+                signal.status = "ignored"
+                signal.reasoning = f"{signal.reasoning} | Ignored: {reasons[signal.id]}"
+
+            session.commit()
+
+            logger.info(f"Marked {len(signals)} signals as ignored")
+
+        except Exception:
+            session.rollback()
+            logger.error(f"Failed to mark {len(reasons)} signals as ignored", exc_info=True)
+            raise
+
+        finally:
+            session.close()
+
     def expire_old_signals(
         self,
         max_age_hours: int = 24
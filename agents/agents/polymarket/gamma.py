@@ -1,5 +1,7 @@
 import httpx
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
 from agents.utils.objects import Market, PolymarketEvent, ClobReward, Tag
 
@@ -178,9 +180,20 @@ class GammaMarketClient:
         Get ALL tradeable markets using pagination.
         Fetches markets in batches until all are retrieved.
         """
-        offset = 0
         all_markets = []
-        while True:
+        for market_batch in self.iter_clob_tradable_market_pages(limit=limit):
+            all_markets.extend(market_batch)
+
+        return all_markets
+
+    def iter_clob_tradable_market_pages(self, limit=100) -> "Iterator[list[Market]]":
+        """
+        Yield pages of tradeable markets as they are fetched.
+        The next page is requested in the background while the caller
+        processes the current one.
+        """
+
+        def fetch(offset):
             params = {
                 "active": True,
                 "closed": False,
@@ -189,14 +202,20 @@ class GammaMarketClient:
                 "offset": offset,
                 "enableOrderBook": True,
             }
-            market_batch = self.get_markets(querystring_params=params)
-            all_markets.extend(market_batch)
-
-            if len(market_batch) < limit:
-                break
-            offset += limit
+            return self.get_markets(querystring_params=params)
 
-        return all_markets
+        offset = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(fetch, offset)
+            while True:
+                market_batch = pending.result()
+                if len(market_batch) < limit:
+                    yield market_batch
+                    break
+
+                offset += limit
+                pending = executor.submit(fetch, offset)
+                yield market_batch
 
     def get_market(self, market_id: int) -> dict():
         url = self.gamma_markets_endpoint + "/" + str(market_id)
@@ -7,7 +7,7 @@ doesn't execute real trades.
 """
 
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import requests
 
 from agents.polymarket.gamma import GammaMarketClient
@@ -75,6 +75,23 @@ class PolymarketPaper:
             self.logger.error(f"Error fetching markets: {e}")
             return []
 
+    def iter_tradeable_market_pages(self) -> Iterator[List[dict]]:
+        """
+        Yield pages of all tradeable markets as they arrive from the API.
+        The next page is fetched while the caller works on the current one.
+
+        Yields:
+            Lists of market dictionaries
+        """
+        count = 0
+        try:
+            for page in self.gamma_client.iter_clob_tradable_market_pages():
+                count += len(page)
+                yield page
+            self.logger.info(f"Retrieved {count} tradeable markets")
+        except Exception as e:
+            self.logger.error(f"Error fetching markets after {count} retrieved: {e}")
+
     def get_all_tradeable_events(self) -> List[SimpleEvent]:
         """
         Get all tradeable events from Polymarket.
@@ -64,6 +64,7 @@ class Config:
     ENDGAME_MIN_PRICE: float = float(os.getenv("ENDGAME_MIN_PRICE", "0.95"))
     ENDGAME_MAX_PRICE: float = float(os.getenv("ENDGAME_MAX_PRICE", "0.99"))
     ENDGAME_MAX_TIME_TO_SETTLEMENT_HOURS: int = int(os.getenv("ENDGAME_MAX_TIME_TO_SETTLEMENT_HOURS", "24"))
+    ENDGAME_ENRICH_MAX_WORKERS: int = int(os.getenv("ENDGAME_ENRICH_MAX_WORKERS", "32"))
 
     MULTI_OPTION_MIN_PROFIT_PCT: float = float(os.getenv("MULTI_OPTION_MIN_PROFIT_PCT", "0.3"))
 
@@ -4,13 +4,17 @@ Uses SQLAlchemy for ORM with support for SQLite and PostgreSQL.
 """
 
 from datetime import datetime
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, Iterable, Iterator, List, Set, Tuple
 from decimal import Decimal
 import time
 import logging
 from functools import wraps
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, Numeric, text
+from sqlalchemy import (
+    create_engine, Column, Integer, SmallInteger, String, Float, DateTime, Boolean, Text, Numeric,
+    Index, Computed, func, text,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -39,6 +43,14 @@ __all__ = [
 ]
 
 
+# SQL expression for Trade.net_profit_sign (shared with the migrations)
+NET_PROFIT_SIGN_SQL = (
+    "CASE WHEN net_profit_usd > 0 THEN 1 "
+    "WHEN net_profit_usd < 0 THEN -1 "
+    "WHEN net_profit_usd = 0 THEN 0 END"
+)
+
+
 class Trade(Base):
     """
     Represents a single trade execution.
@@ -68,6 +80,12 @@ class Trade(Base):
     profit_loss_pct = Column(Float, nullable=True)
     gas_cost_usd = Column(Numeric(10, 6), nullable=True)
     net_profit_usd = Column(Numeric(12, 2), nullable=True)
+    # Sign of net_profit_usd (1 win, -1 loss, 0 breakeven, NULL unsettled), kept by the database
+    net_profit_sign = Column(
+        SmallInteger,
+        Computed(NET_PROFIT_SIGN_SQL, persisted=True),
+        index=True,
+    )
 
     # Timing
     entry_time = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -88,6 +106,13 @@ class Trade(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Composite indexes for the hot read paths (loss limits, reports, open exposure)
+    __table_args__ = (
+        Index("ix_trade_status_entry_time", "status", "entry_time"),
+        Index("ix_trade_strategy_status", "strategy", "status"),
+        Index("ix_trade_market_status", "market_id", "status"),
+    )
+
     def __repr__(self):
         return f"<Trade(id={self.id}, market={self.market_id}, strategy={self.strategy}, pnl={self.profit_loss_usd})>"
 
@@ -525,6 +550,36 @@ class DatabaseManager:
         """Get a new database session."""
         return self.SessionLocal()
 
+    @contextmanager
+    def session_scope(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """
+        Provide a transactional scope around a series of operations.
+
+        If an existing session is passed in it is reused as-is and left open, so
+        callers can share one connection across several helpers. Otherwise a new
+        session is created, committed on success, rolled back on error and closed.
+        Objects are not expired on commit so results stay readable after the scope.
+
+        Args:
+            session: Optional session owned by the caller
+
+        Yields:
+            Database session
+        """
+        if session is not None:
+            yield session
+            return
+
+        session = self.SessionLocal(expire_on_commit=False)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def add_trade(
         self,
         market_id: str,
@@ -618,6 +673,46 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @retry_on_db_error(max_retries=3, initial_delay=0.5)
+    def get_open_trade_keys(self, strategy: Optional[str] = None) -> Set[Tuple[str, str]]:
+        """
+        Get the (market_id, side) pairs of all open trades in one query.
+
+        Args:
+            strategy: Only include trades from this strategy (all if not provided)
+
+        Returns:
+            Set of (market_id, side) tuples
+        """
+        with self.session_scope() as session:
+            query = session.query(Trade.market_id, Trade.side).filter(Trade.status == "open")
+            if strategy:
+                query = query.filter(Trade.strategy == strategy)
+            return {(market_id, side) for market_id, side in query}
+
+    @retry_on_db_error(max_retries=3, initial_delay=0.5)
+    def get_active_trade_counts(self, market_ids: Iterable[str]) -> Dict[str, int]:
+        """
+        Count open trades per market for a batch of markets in one query.
+
+        Args:
+            market_ids: Markets to check
+
+        Returns:
+            Dictionary of market_id -> open trade count, only for markets that
+            have at least one open trade
+        """
+        market_ids = set(market_ids)
+        if not market_ids:
+            return {}
+
+        with self.session_scope() as session:
+            rows = session.query(Trade.market_id, func.count(Trade.id)).filter(
+                Trade.status == "open",
+                Trade.market_id.in_(market_ids)
+            ).group_by(Trade.market_id)
+            return {market_id: count for market_id, count in rows}
+
     def add_market_snapshot(
         self,
         market_id: str,
@@ -678,6 +773,40 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def add_alerts(self, alerts: List[Dict]) -> int:
+        """
+        Create many alerts in one bulk insert and a single commit.
+
+        Args:
+            alerts: List of add_alert() keyword dictionaries
+
+        Returns:
+            Number of alerts created
+        """
+        if not alerts:
+            return 0
+
+        rows = [
+            {
+                "alert_type": alert["alert_type"],
+                "severity": alert.get("severity", "info"),
+                "title": alert["title"],
+                "message": alert["message"],
+                "market_id": alert.get("market_id"),
+                "trade_id": alert.get("trade_id"),
+                "strategy": alert.get("strategy"),
+            }
+            for alert in alerts
+        ]
+
+        session = self.get_session()
+        try:
+            session.bulk_insert_mappings(Alert, rows)
+            session.commit()
+            return len(rows)
+        finally:
+            session.close()
+
     @retry_on_db_error(max_retries=3, initial_delay=0.5)
     def get_strategy_settings(self, strategy_name: str) -> Optional[StrategySettings]:
         """Get settings for a specific strategy with retry logic."""
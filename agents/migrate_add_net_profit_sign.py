@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Database migration: Add net_profit_sign generated column to trades table.
+
+The column holds the sign of net_profit_usd (1, -1, 0, or NULL while a trade is
+open) and is maintained by the database, so win/loss counts and filters can use
+an index instead of re-classifying every row.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.utils.database import db, NET_PROFIT_SIGN_SQL
+from sqlalchemy import inspect, text
+
+def migrate():
+    """Add net_profit_sign column and index if they don't exist."""
+    print("Running migration: Add net_profit_sign column...")
+
+    columns = [column["name"] for column in inspect(db.engine).get_columns("trades")]
+    if "net_profit_sign" in columns:
+        print("✓ Column net_profit_sign already exists, skipping migration")
+        return
+
+    # SQLite can only add VIRTUAL generated columns via ALTER TABLE
+    storage = "STORED" if db.engine.dialect.name == "postgresql" else "VIRTUAL"
+
+    session = db.get_session()
+    try:
+        print("Adding net_profit_sign column...")
+        session.execute(text(f"""
+            ALTER TABLE trades
+            ADD COLUMN net_profit_sign SMALLINT
+            GENERATED ALWAYS AS ({NET_PROFIT_SIGN_SQL}) {storage}
+        """))
+
+        print("Creating index ix_trades_net_profit_sign...")
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_trades_net_profit_sign ON trades (net_profit_sign)"
+        ))
+        session.commit()
+        print("✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    migrate()
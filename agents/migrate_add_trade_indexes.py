@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Database migration: Add composite indexes to the trades table.
+
+Adds indexes for the predicates used by the risk manager and analytics:
+- ix_trade_status_entry_time: daily/weekly loss limits, reports
+- ix_trade_strategy_status: per-strategy performance
+- ix_trade_market_status: open exposure by market
+
+On PostgreSQL the indexes are built CONCURRENTLY so the table stays writable.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.utils.database import db
+from sqlalchemy import text
+
+INDEXES = [
+    ("ix_trade_status_entry_time", "status, entry_time"),
+    ("ix_trade_strategy_status", "strategy, status"),
+    ("ix_trade_market_status", "market_id, status"),
+]
+
+def migrate():
+    """Create trade indexes if they don't exist."""
+    print("Running migration: Add trade indexes...")
+
+    is_postgres = db.engine.dialect.name == "postgresql"
+    concurrently = "CONCURRENTLY " if is_postgres else ""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        try:
+            for name, columns in INDEXES:
+                print(f"Creating index {name}...")
+                conn.execute(text(
+                    f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON trades ({columns})"
+                ))
+            print("✓ Migration completed successfully!")
+
+        except Exception as e:
+            print(f"✗ Migration failed: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate()
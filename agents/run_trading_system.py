@@ -30,7 +30,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from agents.utils.config import config
-from agents.utils.database import db
+from agents.utils.database import db, Trade, NET_PROFIT_SIGN_SQL
 from agents.application.risk_manager import RiskManager
 from agents.application.strategy_manager import StrategyManager
 from agents.application.strategies import EndgameSweepStrategy
@@ -86,6 +86,36 @@ def initialize_database():
                 """))
                 session.commit()
                 print("✓ Migration completed")
+
+            # Check if net_profit_sign column exists (mapped on Trade, so every
+            # trade query fails without it)
+            result = session.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='trades'
+                AND column_name='net_profit_sign'
+            """))
+
+            if not result.fetchone():
+                print("Running migration: Adding net_profit_sign column...")
+                session.execute(text(f"""
+                    ALTER TABLE trades
+                    ADD COLUMN net_profit_sign SMALLINT
+                    GENERATED ALWAYS AS ({NET_PROFIT_SIGN_SQL}) STORED
+                """))
+                session.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_trades_net_profit_sign ON trades (net_profit_sign)"
+                ))
+                session.commit()
+                print("✓ Migration completed")
+
+            # create_all() doesn't add indexes to an existing trades table
+            for index in Trade.__table_args__:
+                columns = ", ".join(column.name for column in index.columns)
+                session.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index.name} ON trades ({columns})"
+                ))
+            session.commit()
         finally:
             session.close()
 
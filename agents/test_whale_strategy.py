@@ -76,14 +76,14 @@ def main():
     print("Copyable Signals:")
     print("-" * 70)
     for i, opp in enumerate(opportunities, 1):
-        print(f"\n{i}. {opp['reasoning']}")
-        print(f"   Whale: {opp['whale_nickname']} ({opp['whale_type']})")
-        print(f"   Quality Score: {opp['whale_quality']:.2f}")
-        print(f"   Market: {opp['market_id'][:10]}...")
-        print(f"   Position: {opp['side']} @ ${opp['current_price']:.3f}")
-        print(f"   Whale Size: ${opp['whale_position_size_usd']:,.2f}")
-        print(f"   Confidence: {opp['confidence']:.2f}")
-        print(f"   Expected Profit: {opp['expected_profit_pct']:.2f}%")
+        print(f"\n{i}. {opp.reasoning}")
+        print(f"   Whale: {opp.whale_nickname} ({opp.whale_type})")
+        print(f"   Quality Score: {opp.whale_quality:.2f}")
+        print(f"   Market: {opp.market_id[:10]}...")
+        print(f"   Position: {opp.side} @ ${opp.current_price:.3f}")
+        print(f"   Whale Size: ${opp.whale_position_size_usd:,.2f}")
+        print(f"   Confidence: {opp.confidence:.2f}")
+        print(f"   Expected Profit: {opp.expected_profit_pct:.2f}%")
 
     print("\n" + "=" * 70)
     print("EXECUTING TRADES (PAPER MODE)")
@@ -92,7 +92,7 @@ def main():
     # Execute opportunities
     trades = []
     for opp in opportunities:
-        print(f"\nExecuting: {opp['whale_nickname']} signal...")
+        print(f"\nExecuting: {opp.whale_nickname} signal...")
         trade = strategy.execute_opportunity(opp)
         if trade:
             trades.append(trade)
@@ -0,0 +1,114 @@
+"""
+% python -m unittest discover
+
+Checks that the aggregate (SQL) and array (NumPy) metric paths agree with the
+in-memory calculate_metrics() path on a seeded SQLite database.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from agents.application import analytics
+from agents.application.analytics import PerformanceAnalyzer
+from agents.utils.database import DatabaseManager, Trade
+
+# (strategy, status, net_profit_usd, gas_cost_usd)
+SEED_TRADES = [
+    ("a", "closed", 2.0, 0.1),
+    ("a", "settled", 1.0, 0.2),
+    ("a", "settled", -3.0, None),
+    ("a", "open", None, None),
+    ("b", "closed", -1.0, 0.1),
+    ("b", "closed", 0.0, 0.0),
+    ("b", "closed", None, 0.3),
+    ("b", "settled", -0.33, 0.2),
+    ("c", "closed", 1.37, 0.01),
+    ("c", "settled", 5.25, 0.0),
+    ("c", "settled", 0.0, 0.05),
+    ("d", "closed", 1.5, 0.05),
+]
+
+
+class TestMetricsPaths(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseManager("sqlite://")
+        self.db.create_tables()
+        patcher = mock.patch.object(analytics, "db", self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.db.engine.dispose)
+
+        now = datetime.utcnow()
+        with self.db.session_scope() as session:
+            for i, (strategy, status, net_profit, gas_cost) in enumerate(SEED_TRADES):
+                session.add(
+                    Trade(
+                        strategy=strategy,
+                        market_id=str(i),
+                        market_question="Will it happen?",
+                        side="YES",
+                        entry_price=0.5,
+                        size_usd=10,
+                        entry_time=now - timedelta(hours=i),
+                        status=status,
+                        net_profit_usd=net_profit,
+                        gas_cost_usd=gas_cost,
+                    )
+                )
+
+        self.analyzer = PerformanceAnalyzer()
+
+    def _orm_metrics(self, strategy=None, status=None):
+        session = self.db.get_session()
+        try:
+            query = session.query(Trade)
+            if strategy:
+                query = query.filter(Trade.strategy == strategy)
+            if status:
+                query = query.filter(Trade.status == status)
+            return self.analyzer.calculate_metrics(query.all())
+        finally:
+            session.close()
+
+    def assertMetricsEqual(self, expected, actual):
+        self.assertEqual(set(expected), set(actual))
+        for key, value in expected.items():
+            self.assertAlmostEqual(float(actual[key]), float(value), places=9, msg=key)
+
+    def test_paths_match_orm(self):
+        filters = [
+            {},
+            {"status": "closed"},
+            {"status": "settled"},
+            {"strategy": "a"},
+            {"strategy": "b", "status": "closed"},
+            {"strategy": "c", "status": "settled"},
+            {"strategy": "missing"},
+        ]
+        for kwargs in filters:
+            with self.subTest(**kwargs):
+                expected = self._orm_metrics(**kwargs)
+                self.assertMetricsEqual(
+                    expected, self.analyzer.calculate_metrics_sql(**kwargs)
+                )
+                self.assertMetricsEqual(
+                    expected, self.analyzer.calculate_metrics_decimal(**kwargs)
+                )
+                self.assertMetricsEqual(
+                    expected,
+                    self.analyzer.calculate_metrics_from_arrays(
+                        *self.analyzer.get_trade_returns(**kwargs)
+                    ),
+                )
+
+    def test_breakeven_and_missing_profit(self):
+        metrics = self.analyzer.calculate_metrics_sql(status="closed")
+        self.assertEqual(metrics["total_trades"], 6)
+        self.assertEqual(metrics["winning_trades"], 3)
+        self.assertEqual(metrics["losing_trades"], 1)
+        self.assertEqual(metrics["breakeven_trades"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()